@@ -1,6 +1,28 @@
 """Backtesting package with team-routed engines."""
 
-from backtest.engine import BacktestConfig, BacktestEngine, BacktestResult
-from backtest.engine_router import resolve_backtest_engine
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from backtest.engine import BacktestConfig, BacktestEngine, BacktestResult
+    from backtest.engine_router import resolve_backtest_engine
 
 __all__ = ["BacktestConfig", "BacktestEngine", "BacktestResult", "resolve_backtest_engine"]
+
+# Resolved on first access, so importing backtest.data_loader does not
+# pull in the engine and the signal generation stack behind it
+_LAZY_EXPORTS = {
+    "BacktestConfig": "backtest.engine",
+    "BacktestEngine": "backtest.engine",
+    "BacktestResult": "backtest.engine",
+    "resolve_backtest_engine": "backtest.engine_router",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
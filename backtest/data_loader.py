@@ -3,10 +3,13 @@ Backtest Data Loader
 Provides chronologically sorted candle data for backtesting.
 """
 
+import csv
 import logging
+import os
 from datetime import datetime
 from decimal import Decimal
-from typing import Iterator, List, Optional
+from functools import lru_cache
+from typing import Iterator, List, Optional, Tuple
 
 from shared.database import get_questdb
 from shared.models import Candle, Market
@@ -14,6 +17,44 @@ from shared.models import Candle, Market
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=64)
+def _read_csv_candles(
+    filepath: str,
+    mtime_ns: int,
+    market: Market,
+    symbol: str,
+    interval: str,
+) -> Tuple[Candle, ...]:
+    """
+    Parse a candle CSV, sorted by timestamp.
+    
+    Cached per file modification time, so repeated loads of an unchanged
+    file (walk-forward windows, parameter sweeps) skip the parse. Candles
+    are frozen, so the cached tuple is safe to share.
+    """
+    with open(filepath, "r") as f:
+        reader = csv.DictReader(f)
+        
+        # Sort by timestamp (in case CSV isn't sorted)
+        rows = sorted(reader, key=lambda r: r["timestamp"])
+    
+    return tuple(
+        Candle(
+            market=market,
+            symbol=symbol,
+            timestamp=datetime.fromisoformat(row["timestamp"]),
+            open=Decimal(row["open"]),
+            high=Decimal(row["high"]),
+            low=Decimal(row["low"]),
+            close=Decimal(row["close"]),
+            volume=Decimal(row.get("volume", "0")),
+            interval=interval,
+            is_closed=True,
+        )
+        for row in rows
+    )
+
+
 class BacktestDataLoader:
     """
     Loads historical candle data for backtesting.
@@ -80,7 +121,8 @@ class BacktestDataLoader:
         symbol_filter = ", ".join(f"'{s}'" for s in symbols)
         
         query = f"""
-        SELECT * FROM candles
+        SELECT symbol, timestamp, open, high, low, close, volume, quote_volume, trades
+        FROM candles
         WHERE market = '{self._market.value}'
           AND symbol IN ({symbol_filter})
           AND timestamp >= '{start.isoformat()}'
@@ -88,20 +130,31 @@ class BacktestDataLoader:
         ORDER BY timestamp ASC
         """
         
-        rows = questdb.query(query)
+        cols = questdb.query_columns(query)
         
-        for row in rows:
+        market = self._market
+        for symbol, ts, o, h, l, c, v, qv, trades in zip(
+            cols["symbol"],
+            cols["timestamp"],
+            cols["open"],
+            cols["high"],
+            cols["low"],
+            cols["close"],
+            cols["volume"],
+            cols["quote_volume"],
+            cols["trades"],
+        ):
             yield Candle(
-                market=Market(row["market"]),
-                symbol=row["symbol"],
-                timestamp=datetime.fromisoformat(row["timestamp"]),
-                open=Decimal(str(row["open"])),
-                high=Decimal(str(row["high"])),
-                low=Decimal(str(row["low"])),
-                close=Decimal(str(row["close"])),
-                volume=Decimal(str(row["volume"])),
-                quote_volume=Decimal(str(row.get("quote_volume", 0))),
-                trades=row.get("trades", 0),
+                market=market,
+                symbol=symbol,
+                timestamp=datetime.fromisoformat(ts),
+                open=Decimal(str(o)),
+                high=Decimal(str(h)),
+                low=Decimal(str(l)),
+                close=Decimal(str(c)),
+                volume=Decimal(str(v)),
+                quote_volume=Decimal(str(qv or 0)),
+                trades=trades or 0,
                 interval=interval,
                 is_closed=True,
             )
@@ -125,27 +178,8 @@ class BacktestDataLoader:
         Yields:
             Candles in chronological order
         """
-        import csv
-        
-        with open(filepath, "r") as f:
-            reader = csv.DictReader(f)
-            
-            # Sort by timestamp (in case CSV isn't sorted)
-            rows = sorted(reader, key=lambda r: r["timestamp"])
-            
-            for row in rows:
-                yield Candle(
-                    market=self._market,
-                    symbol=symbol,
-                    timestamp=datetime.fromisoformat(row["timestamp"]),
-                    open=Decimal(row["open"]),
-                    high=Decimal(row["high"]),
-                    low=Decimal(row["low"]),
-                    close=Decimal(row["close"]),
-                    volume=Decimal(row.get("volume", "0")),
-                    interval=interval,
-                    is_closed=True,
-                )
+        mtime_ns = os.stat(filepath).st_mtime_ns
+        yield from _read_csv_candles(filepath, mtime_ns, self._market, symbol, interval)
 
 
 def create_candle_provider(
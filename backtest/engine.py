@@ -112,6 +112,7 @@ class BacktestEngine:
             market=config.market,
             initial_balance=config.initial_capital,
             random_seed=config.random_seed,
+            simulate_latency=False,
         )
         self._signal_engine = SignalGenerationEngine(
             market=config.market,
@@ -124,6 +125,7 @@ class BacktestEngine:
         self._current_time: Optional[datetime] = None
         self._positions: Dict[str, Position] = {}  # symbol -> position
         self._trades: List[TradeRecord] = []
+        self._realized_pnl = Decimal("0")  # running sum of trade P&L
         self._equity_curve: List[Tuple[datetime, Decimal]] = []
         self._peak_equity: Decimal = config.initial_capital
         self._max_drawdown: Decimal = Decimal("0")
@@ -176,8 +178,10 @@ class BacktestEngine:
         self._signal_engine.reset()
         self._current_time = None
         self._positions.clear()
-        self._trades.clear()
-        self._equity_curve.clear()
+        # Fresh lists: a previous BacktestResult still references the old ones
+        self._trades = []
+        self._realized_pnl = Decimal("0")
+        self._equity_curve = []
         self._peak_equity = self._config.initial_capital
         self._max_drawdown = Decimal("0")
     
@@ -231,7 +235,7 @@ class BacktestEngine:
                 self._open_position(signal, candle, OrderSide.BUY)
         
         elif signal.action == SignalAction.EXIT_LONG:
-            if existing_position and existing_position.side == OrderSide.BUY:
+            if existing_position and existing_position.side is OrderSide.BUY:
                 self._close_position(existing_position, candle)
         
         elif signal.action == SignalAction.ENTER_SHORT:
@@ -239,7 +243,7 @@ class BacktestEngine:
                 self._open_position(signal, candle, OrderSide.SELL)
         
         elif signal.action == SignalAction.EXIT_SHORT:
-            if existing_position and existing_position.side == OrderSide.SELL:
+            if existing_position and existing_position.side is OrderSide.SELL:
                 self._close_position(existing_position, candle)
     
     def _open_position(
@@ -291,7 +295,7 @@ class BacktestEngine:
         # Simulate exit fill
         simulator = get_fill_simulator(self._config.random_seed)
         
-        exit_side = OrderSide.SELL if position.side == OrderSide.BUY else OrderSide.BUY
+        exit_side = OrderSide.SELL if position.side is OrderSide.BUY else OrderSide.BUY
         
         order = Order(
             market=self._config.market,
@@ -306,7 +310,7 @@ class BacktestEngine:
         result = simulator.simulate_fill(order, candle.close)
         
         # Calculate P&L
-        if position.side == OrderSide.BUY:
+        if position.side is OrderSide.BUY:
             pnl = (result.executed_price - position.avg_entry_price) * position.quantity
         else:
             pnl = (position.avg_entry_price - result.executed_price) * position.quantity
@@ -329,6 +333,7 @@ class BacktestEngine:
             holding_period_days=max(1, holding_days),
         )
         self._trades.append(trade)
+        self._realized_pnl += pnl
         
         # Remove position
         del self._positions[position.symbol]
@@ -344,7 +349,7 @@ class BacktestEngine:
             price = position.current_price or position.avg_entry_price
             
             # Calculate final P&L
-            if position.side == OrderSide.BUY:
+            if position.side is OrderSide.BUY:
                 pnl = (price - position.avg_entry_price) * position.quantity
             else:
                 pnl = (position.avg_entry_price - price) * position.quantity
@@ -364,13 +369,14 @@ class BacktestEngine:
                 holding_period_days=1,
             )
             self._trades.append(trade)
+            self._realized_pnl += pnl
     
     def _update_position_pnl(self, position: Position) -> None:
         """Update unrealized P&L for a position."""
         if position.current_price is None:
             return
         
-        if position.side == OrderSide.BUY:
+        if position.side is OrderSide.BUY:
             position.unrealized_pnl = (
                 (position.current_price - position.avg_entry_price) * position.quantity
             )
@@ -381,11 +387,8 @@ class BacktestEngine:
     
     def _calculate_equity(self) -> Decimal:
         """Calculate current equity."""
-        balance = self._config.initial_capital
-        
-        # Add realized P&L from completed trades
-        for trade in self._trades:
-            balance += trade.pnl
+        # Initial capital plus realized P&L from completed trades
+        balance = self._config.initial_capital + self._realized_pnl
         
         # Add unrealized P&L
         for position in self._positions.values():
@@ -8,6 +8,7 @@ Fixed window sizes (as per assumptions):
 """
 
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from decimal import Decimal
@@ -153,26 +154,46 @@ class WalkForwardValidator:
             logger.warning("No valid walk-forward windows generated")
             return result
         
-        # Run each window
-        for window in result.windows:
-            logger.info(f"Running window {window.window_id}: IS {window.in_sample_start} - {window.in_sample_end}")
-            
-            # In-sample backtest
-            is_result = self._run_window(
-                window.in_sample_start,
-                window.in_sample_end,
-            )
-            result.in_sample_results.append(is_result)
-            
-            # Out-of-sample backtest
-            oos_result = self._run_window(
-                window.out_of_sample_start,
-                window.out_of_sample_end,
+        # Backtest periods in run order: IS then OOS for each window
+        periods = [
+            period
+            for window in result.windows
+            for period in (
+                (window.in_sample_start, window.in_sample_end),
+                (window.out_of_sample_start, window.out_of_sample_end),
             )
-            result.out_of_sample_results.append(oos_result)
+        ]
+        
+        # Load the next period's candles while the current one is backtested
+        with ThreadPoolExecutor(max_workers=1) as loader:
+            pending = self._prefetch(loader, *periods[0])
             
-            # Add OOS equity to combined curve
-            result.oos_equity_curve.extend(oos_result.equity_curve)
+            for i, window in enumerate(result.windows):
+                logger.info(f"Running window {window.window_id}: IS {window.in_sample_start} - {window.in_sample_end}")
+                
+                # In-sample backtest
+                candles = pending.result()
+                pending = self._prefetch(loader, *periods[2 * i + 1])
+                is_result = self._run_window(
+                    window.in_sample_start,
+                    window.in_sample_end,
+                    candles,
+                )
+                result.in_sample_results.append(is_result)
+                
+                # Out-of-sample backtest
+                candles = pending.result()
+                if 2 * i + 2 < len(periods):
+                    pending = self._prefetch(loader, *periods[2 * i + 2])
+                oos_result = self._run_window(
+                    window.out_of_sample_start,
+                    window.out_of_sample_end,
+                    candles,
+                )
+                result.out_of_sample_results.append(oos_result)
+                
+                # Add OOS equity to combined curve
+                result.oos_equity_curve.extend(oos_result.equity_curve)
         
         # Calculate aggregate statistics
         self._calculate_aggregates(result)
@@ -185,10 +206,22 @@ class WalkForwardValidator:
         
         return result
     
+    def _prefetch(
+        self,
+        loader: ThreadPoolExecutor,
+        start: datetime,
+        end: datetime,
+    ) -> "Future[List[Candle]]":
+        """Load a period's candles on the loader thread."""
+        return loader.submit(
+            lambda: list(self._candle_provider(start, end, self._config.symbols))
+        )
+    
     def _run_window(
         self,
         start: datetime,
         end: datetime,
+        candles: List[Candle],
     ) -> BacktestResult:
         """Run backtest for a single window."""
         config = BacktestConfig(
@@ -204,14 +237,7 @@ class WalkForwardValidator:
         
         engine = resolve_backtest_engine(self._config.team)(config)
         
-        # Get candles for window
-        candles = self._candle_provider(
-            start,
-            end,
-            self._config.symbols,
-        )
-        
-        return engine.run(candles)
+        return engine.run(iter(candles))
     
     def _calculate_aggregates(self, result: WalkForwardResult) -> None:
         """Calculate aggregate statistics from window results."""
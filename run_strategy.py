@@ -27,6 +27,7 @@ if str(PROJECT_ROOT) not in sys.path:
 # standalone 모드 (NATS/DB 없이 동작)
 os.environ["STANDALONE_MODE"] = "true"
 
+from shared import event_loop
 from shared.config import apply_strategy_config, get_settings
 from shared.models import Market, TeamType, TradingMode
 from services.broker_factory import create_broker, create_data_feed
@@ -55,19 +56,25 @@ def scan_strategies() -> dict[str, dict]:
     strategies_dir = PROJECT_ROOT / "strategies"
     found: dict[str, dict] = {}
 
-    for py_file in sorted(strategies_dir.glob("*.py")):
-        if py_file.name.startswith("_"):
-            continue
-
-        module_name = f"strategies.{py_file.stem}"
+    # 파일 이름만 필요하므로 Path 객체 없이 scandir 로 한 번에 나열
+    with os.scandir(strategies_dir) as entries:
+        file_names = [
+            entry.name
+            for entry in entries
+            if entry.name.endswith(".py") and not entry.name.startswith("_") and entry.is_file()
+        ]
+    file_names.sort()
+
+    for file_name in file_names:
+        module_name = f"strategies.{file_name[:-3]}"
         try:
             mod: ModuleType = importlib.import_module(module_name)
             config = getattr(mod, "STRATEGY_CONFIG", None)
             if config and isinstance(config, dict) and "name" in config:
                 found[config["name"]] = config
-                logger.debug(f"전략 발견: {config['name']} ({py_file.name})")
+                logger.debug(f"전략 발견: {config['name']} ({file_name})")
         except Exception as e:
-            logger.warning(f"전략 로드 실패: {py_file.name} → {e}")
+            logger.warning(f"전략 로드 실패: {file_name} → {e}")
 
     return found
 
@@ -296,7 +303,7 @@ def main() -> int:
     strategy_config = strategies[selected]
     print(f"\n>>> 전략 '{selected}' 실행 <<<\n")
 
-    return asyncio.run(run_async(strategy_config))
+    return event_loop.run(run_async(strategy_config))
 
 
 if __name__ == "__main__":
@@ -2,11 +2,15 @@
 NATS JetStream Initialization Script
 Creates streams and consumers for the trading system.
 
+Payloads are zstd-compressed by the publisher (see shared/codec.py),
+so stream max_bytes limits refer to compressed bytes.
+
 Usage:
     python scripts/init_nats.py
 """
 
 import asyncio
+import json
 import logging
 from typing import List
 
@@ -16,6 +20,11 @@ from nats.js.api import StreamConfig, ConsumerConfig, AckPolicy, DeliverPolicy,
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Duration constants (JetStream expects nanoseconds)
+_NS = 1_000_000_000
+_DAY_NS = 86_400 * _NS
+_WEEK_NS = 7 * _DAY_NS
+
 # Stream configurations
 STREAMS: List[StreamConfig] = [
     StreamConfig(
@@ -24,10 +33,10 @@ STREAMS: List[StreamConfig] = [
         retention=RetentionPolicy.LIMITS,
         max_msgs=1_000_000,
         max_bytes=1024 * 1024 * 1024,  # 1GB
-        max_age=7 * 24 * 60 * 60 * 1_000_000_000,  # 7 days in nanoseconds
+        max_age=_WEEK_NS,
         storage="file",
         num_replicas=1,
-        duplicate_window=60 * 1_000_000_000,  # 60 seconds
+        duplicate_window=60 * _NS,
     ),
     StreamConfig(
         name="STRATEGY",
@@ -35,10 +44,10 @@ STREAMS: List[StreamConfig] = [
         retention=RetentionPolicy.LIMITS,
         max_msgs=100_000,
         max_bytes=256 * 1024 * 1024,  # 256MB
-        max_age=7 * 24 * 60 * 60 * 1_000_000_000,
+        max_age=_WEEK_NS,
         storage="file",
         num_replicas=1,
-        duplicate_window=60 * 1_000_000_000,
+        duplicate_window=60 * _NS,
     ),
     StreamConfig(
         name="TRADE",
@@ -46,10 +55,10 @@ STREAMS: List[StreamConfig] = [
         retention=RetentionPolicy.LIMITS,
         max_msgs=100_000,
         max_bytes=256 * 1024 * 1024,
-        max_age=30 * 24 * 60 * 60 * 1_000_000_000,  # 30 days
+        max_age=30 * _DAY_NS,
         storage="file",
         num_replicas=1,
-        duplicate_window=60 * 1_000_000_000,
+        duplicate_window=60 * _NS,
     ),
     StreamConfig(
         name="RISK",
@@ -57,10 +66,10 @@ STREAMS: List[StreamConfig] = [
         retention=RetentionPolicy.LIMITS,
         max_msgs=10_000,
         max_bytes=64 * 1024 * 1024,
-        max_age=90 * 24 * 60 * 60 * 1_000_000_000,  # 90 days
+        max_age=90 * _DAY_NS,
         storage="file",
         num_replicas=1,
-        duplicate_window=60 * 1_000_000_000,
+        duplicate_window=60 * _NS,
     ),
     StreamConfig(
         name="SYSTEM",
@@ -68,13 +77,18 @@ STREAMS: List[StreamConfig] = [
         retention=RetentionPolicy.LIMITS,
         max_msgs=50_000,
         max_bytes=128 * 1024 * 1024,
-        max_age=7 * 24 * 60 * 60 * 1_000_000_000,
+        max_age=_WEEK_NS,
         storage="file",
         num_replicas=1,
-        duplicate_window=60 * 1_000_000_000,
+        duplicate_window=60 * _NS,
     ),
 ]
 
+_JS_API_PREFIX = "$JS.API"
+
+# Stream API payloads, encoded once at import
+_STREAM_PAYLOADS = {cfg.name: json.dumps(cfg.as_dict()).encode() for cfg in STREAMS}
+
 # Consumer configurations per stream
 CONSUMERS = {
     "MARKET": [
@@ -83,7 +97,7 @@ CONSUMERS = {
             ack_policy=AckPolicy.EXPLICIT,
             deliver_policy=DeliverPolicy.NEW,
             max_deliver=3,
-            ack_wait=30 * 1_000_000_000,  # 30 seconds
+            ack_wait=30 * _NS,
         ),
     ],
     "STRATEGY": [
@@ -92,7 +106,7 @@ CONSUMERS = {
             ack_policy=AckPolicy.EXPLICIT,
             deliver_policy=DeliverPolicy.NEW,
             max_deliver=3,
-            ack_wait=30 * 1_000_000_000,
+            ack_wait=30 * _NS,
         ),
     ],
     "TRADE": [
@@ -101,14 +115,14 @@ CONSUMERS = {
             ack_policy=AckPolicy.EXPLICIT,
             deliver_policy=DeliverPolicy.NEW,
             max_deliver=3,
-            ack_wait=30 * 1_000_000_000,
+            ack_wait=30 * _NS,
         ),
         ConsumerConfig(
             durable_name="position_tracker_consumer",
             ack_policy=AckPolicy.EXPLICIT,
             deliver_policy=DeliverPolicy.NEW,
             max_deliver=3,
-            ack_wait=30 * 1_000_000_000,
+            ack_wait=30 * _NS,
         ),
     ],
     "RISK": [
@@ -117,7 +131,7 @@ CONSUMERS = {
             ack_policy=AckPolicy.EXPLICIT,
             deliver_policy=DeliverPolicy.NEW,
             max_deliver=1,  # Kill switch should not retry
-            ack_wait=5 * 1_000_000_000,
+            ack_wait=5 * _NS,
         ),
     ],
     "SYSTEM": [
@@ -126,12 +140,29 @@ CONSUMERS = {
             ack_policy=AckPolicy.EXPLICIT,
             deliver_policy=DeliverPolicy.NEW,
             max_deliver=3,
-            ack_wait=30 * 1_000_000_000,
+            ack_wait=30 * _NS,
         ),
     ],
 }
 
 
+async def _stream_api_request(nc: nats.NATS, action: str, stream_name: str) -> dict:
+    """Send a cached stream payload to the JetStream API (CREATE / UPDATE)."""
+    try:
+        msg = await nc.request(
+            f"{_JS_API_PREFIX}.STREAM.{action}.{stream_name}",
+            _STREAM_PAYLOADS[stream_name],
+            timeout=5,
+        )
+    except nats.errors.NoRespondersError:
+        raise nats.js.errors.NotFoundError
+    
+    resp = json.loads(msg.data)
+    if "error" in resp:
+        raise nats.js.errors.APIError.from_error(resp["error"])
+    return resp
+
+
 async def init_nats(nats_url: str = "nats://localhost:4222") -> None:
     """
     Initialize NATS JetStream streams and consumers.
@@ -149,10 +180,10 @@ async def init_nats(nats_url: str = "nats://localhost:4222") -> None:
                 # Try to get existing stream
                 stream_info = await js.stream_info(stream_config.name)
                 logger.info(f"Stream '{stream_config.name}' already exists, updating...")
-                await js.update_stream(config=stream_config)
+                await _stream_api_request(nc, "UPDATE", stream_config.name)
             except nats.js.errors.NotFoundError:
                 logger.info(f"Creating stream '{stream_config.name}'...")
-                await js.add_stream(config=stream_config)
+                await _stream_api_request(nc, "CREATE", stream_config.name)
             
             logger.info(f"Stream '{stream_config.name}' configured with subjects: {stream_config.subjects}")
         
@@ -168,20 +199,28 @@ async def init_nats(nats_url: str = "nats://localhost:4222") -> None:
         
         logger.info("NATS JetStream initialization complete!")
         
-        # Print summary
-        logger.info("\n" + "=" * 60)
-        logger.info("NATS JetStream Summary")
-        logger.info("=" * 60)
+        # Print summary (collected first, emitted as a single log record)
+        summary_lines = ["", "=" * 60, "NATS JetStream Summary", "=" * 60]
         for stream_config in STREAMS:
             stream_info = await js.stream_info(stream_config.name)
-            logger.info(f"Stream: {stream_config.name}")
-            logger.info(f"  Subjects: {stream_config.subjects}")
-            logger.info(f"  Messages: {stream_info.state.messages}")
-            logger.info(f"  Bytes: {stream_info.state.bytes}")
+            summary_lines.append(f"Stream: {stream_config.name}")
+            summary_lines.append(f"  Subjects: {stream_config.subjects}")
+            summary_lines.append(f"  Messages: {stream_info.state.messages}")
+            summary_lines.append(f"  Bytes: {stream_info.state.bytes}")
+        logger.info("\n".join(summary_lines))
         
     finally:
         await nc.close()
 
 
 if __name__ == "__main__":
-    asyncio.run(init_nats())
+    # Standalone script: use uvloop directly rather than importing shared/
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+    
+    if uvloop is not None:
+        uvloop.run(init_nats())
+    else:
+        asyncio.run(init_nats())
@@ -6,10 +6,10 @@ Checks that:
 2) Closed candles are persisted to QuestDB line protocol writer
 """
 
-import asyncio
 from datetime import datetime, timezone
 from decimal import Decimal
 
+from shared import event_loop
 from shared.models import Candle, Market
 from services.data_feed.crypto_feed import CryptoDataFeed
 import services.data_feed.crypto_feed as crypto_feed_module
@@ -84,4 +84,4 @@ async def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(asyncio.run(main()))
+    raise SystemExit(event_loop.run(main()))
@@ -9,6 +9,7 @@ import sys
 from datetime import datetime, timedelta
 from decimal import Decimal
 
+from shared import event_loop
 from shared.config import get_settings
 from shared.models import (
     Candle,
@@ -69,9 +70,8 @@ def test_strategy_signals():
     print("TEST: Strategy Signal Generation")
     print("=" * 50)
     
-    clear_strategy_cache()
     strategy = get_strategy("turtle_breakout")
-    strategy.initialize()
+    strategy.reset()
     
     # Generate test candles with uptrend
     candles = []
@@ -228,17 +228,28 @@ def test_backtest_engine():
         return False
 
 
+def _run_strategy_tests():
+    """Run the strategy-dependent tests sequentially."""
+    return test_strategy_loader(), test_strategy_signals(), test_backtest_engine()
+
+
 async def run_all_tests():
     """Run all validation tests."""
     print("\n" + "=" * 60)
     print("TRADING SYSTEM VALIDATION")
     print("=" * 60)
     
+    # The broker test runs alongside the strategy tests, which share the
+    # cached strategy instance and so run in order on one worker thread
+    (loader_ok, signals_ok, backtest_ok), broker_ok = await asyncio.gather(
+        asyncio.to_thread(_run_strategy_tests),
+        test_broker_stub(),
+    )
     results = {
-        "Strategy Loader": test_strategy_loader(),
-        "Strategy Signals": test_strategy_signals(),
-        "Broker Stub": await test_broker_stub(),
-        "Backtest Engine": test_backtest_engine(),
+        "Strategy Loader": loader_ok,
+        "Strategy Signals": signals_ok,
+        "Broker Stub": broker_ok,
+        "Backtest Engine": backtest_ok,
     }
     
     print("\n" + "=" * 60)
@@ -261,7 +272,7 @@ async def run_all_tests():
 
 def main():
     """Main entry point."""
-    success = asyncio.run(run_all_tests())
+    success = event_loop.run(run_all_tests())
     return 0 if success else 1
 
 
@@ -10,7 +10,8 @@ Usage:
 """
 
 import logging
-from typing import Optional
+from functools import lru_cache
+from typing import Callable, Optional
 
 from shared.config import get_settings
 from shared.models import Market
@@ -20,49 +21,76 @@ from services.execution.base import BrokerAdapter
 logger = logging.getLogger(__name__)
 
 
-def create_broker(market: Optional[Market] = None) -> BrokerAdapter:
-    """
-    설정에 기반하여 브로커 어댑터를 생성합니다.
-    
-    Args:
-        market: 마켓 지정 (None이면 설정에서 읽음)
-    
-    Returns:
-        적절한 BrokerAdapter 인스턴스
+@lru_cache(maxsize=4)
+def _resolve_broker_factory(
+    market: Market,
+    kr_broker: str,
+    binance_testnet: bool,
+) -> Callable[[], BrokerAdapter]:
     """
-    settings = get_settings()
-    market = market or settings.market
+    마켓/브로커 설정 조합에 맞는 브로커 생성 함수를 반환합니다.
 
+    설정 조합이 같으면 분기 해석과 모듈 임포트를 다시 하지 않도록 캐시합니다.
+    반환된 함수는 호출할 때마다 새 어댑터 인스턴스를 생성합니다.
+    """
     if market == Market.CRYPTO:
         from services.execution.crypto_binance import CryptoBinanceAdapter
-        testnet = settings.binance.testnet
-        logger.info(f"Binance 브로커 생성 ({'테스트넷' if testnet else '메인넷'})")
-        return CryptoBinanceAdapter(testnet=testnet)
 
-    elif market == Market.KR:
-        kr_broker = settings.kr_broker
+        def build() -> BrokerAdapter:
+            logger.info(f"Binance 브로커 생성 ({'테스트넷' if binance_testnet else '메인넷'})")
+            return CryptoBinanceAdapter(testnet=binance_testnet)
 
+        return build
+
+    elif market == Market.KR:
         if kr_broker == "kiwoom":
             from services.execution.kiwoom_broker import KiwoomBrokerAdapter
-            logger.info("키움증권 브로커 생성")
-            return KiwoomBrokerAdapter()
+
+            def build() -> BrokerAdapter:
+                logger.info("키움증권 브로커 생성")
+                return KiwoomBrokerAdapter()
+
+            return build
         else:
             # kis (기본값) 또는 both (KIS 우선)
             from services.execution.broker_stub import BrokerStub
-            logger.info("한국투자증권 브로커 생성 (BrokerStub)")
-            # 참고: KIS 실 주문 어댑터는 별도 구현 필요
-            # 현재는 BrokerStub(Paper)을 반환
-            return BrokerStub(market=Market.KR)
+
+            def build() -> BrokerAdapter:
+                logger.info("한국투자증권 브로커 생성 (BrokerStub)")
+                # 참고: KIS 실 주문 어댑터는 별도 구현 필요
+                # 현재는 BrokerStub(Paper)을 반환
+                return BrokerStub(market=Market.KR, simulate_latency=True)
+
+            return build
 
     elif market == Market.US:
         from services.execution.broker_stub import BrokerStub
-        logger.info("미국 주식 브로커 생성 (BrokerStub)")
-        return BrokerStub(market=Market.US)
+
+        def build() -> BrokerAdapter:
+            logger.info("미국 주식 브로커 생성 (BrokerStub)")
+            return BrokerStub(market=Market.US, simulate_latency=True)
+
+        return build
 
     else:
         raise ValueError(f"지원하지 않는 마켓: {market}")
 
 
+def create_broker(market: Optional[Market] = None) -> BrokerAdapter:
+    """
+    설정에 기반하여 브로커 어댑터를 생성합니다.
+    
+    Args:
+        market: 마켓 지정 (None이면 설정에서 읽음)
+    
+    Returns:
+        적절한 BrokerAdapter 인스턴스
+    """
+    settings = get_settings()
+    market = market or settings.market
+    return _resolve_broker_factory(market, settings.kr_broker, settings.binance.testnet)()
+
+
 def create_data_feed(market: Optional[Market] = None) -> DataFeedProvider:
     """
     설정에 기반하여 데이터 피드를 생성합니다.
@@ -116,7 +144,7 @@ def create_all_kr_brokers() -> dict[str, BrokerAdapter]:
 
     try:
         from services.execution.broker_stub import BrokerStub
-        brokers["kis"] = BrokerStub(market=Market.KR)
+        brokers["kis"] = BrokerStub(market=Market.KR, simulate_latency=True)
         logger.info("KIS 브로커 생성 완료")
     except Exception as e:
         logger.error(f"KIS 브로커 생성 실패: {e}")
@@ -0,0 +1,53 @@
+"""
+Live Candle Registry Entry
+Mutable in-flight candle, updated in place on every kline tick.
+
+The feed keeps one LiveCandle per symbol/interval holding the exchange's
+raw decimal strings, persists closed candles straight from it, and builds
+one immutable Candle snapshot per tick for the queue / NATS publish.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Optional
+
+from shared.models import Candle, Market
+
+
+@dataclass(slots=True)
+class LiveCandle:
+    """In-flight OHLCV candle for a single symbol/interval."""
+    symbol: str
+    interval: str
+    start_ms: int = 0
+    open: str = "0"
+    high: str = "0"
+    low: str = "0"
+    close: str = "0"
+    volume: str = "0"
+    quote_volume: str = "0"
+    trades: Optional[int] = None
+    is_closed: bool = False
+
+    @property
+    def timestamp_ns(self) -> int:
+        """Candle open time in nanoseconds (QuestDB ILP timestamp)."""
+        return self.start_ms * 1_000_000
+
+    def to_candle(self, market: Market) -> Candle:
+        """Materialize an immutable Candle snapshot."""
+        return Candle(
+            market=market,
+            symbol=self.symbol,
+            timestamp=datetime.fromtimestamp(self.start_ms / 1000, tz=timezone.utc),
+            open=Decimal(self.open),
+            high=Decimal(self.high),
+            low=Decimal(self.low),
+            close=Decimal(self.close),
+            volume=Decimal(self.volume),
+            quote_volume=Decimal(self.quote_volume),
+            trades=self.trades,
+            interval=self.interval,
+            is_closed=self.is_closed,
+        )
@@ -6,14 +6,15 @@ WebSocket-based market data collection for crypto markets.
 import asyncio
 import json
 import logging
-from datetime import datetime, timezone
+from datetime import datetime
 from decimal import Decimal
-from typing import AsyncIterator, Dict, List, Optional, cast
+from typing import AsyncIterator, Dict, Iterator, List, Optional, cast
 
 from shared.config import get_settings
 from shared.database import get_questdb
 from shared.models import Candle, Market
 
+from ._live_candle import LiveCandle
 from .base import DataFeedError, DataFeedProvider
 
 logger = logging.getLogger(__name__)
@@ -68,6 +69,7 @@ class CryptoDataFeed(DataFeedProvider):
         self._ws: Optional[WebSocketClientProtocol] = None
         self._subscriptions: set[str] = set()
         self._candle_queue: asyncio.Queue[Candle] = asyncio.Queue()
+        self._live_candles: Dict[str, LiveCandle] = {}  # "symbol:interval" -> in-flight candle
         self._receive_task: Optional[asyncio.Task] = None
 
         if self._exchange not in {"binance", "bybit"}:
@@ -185,42 +187,51 @@ class CryptoDataFeed(DataFeedProvider):
             if self._is_subscription_confirmation(data):
                 return
 
-            candles = self._extract_candles_from_message(data)
-            for candle in candles:
+            publish = self._publish_enabled()
+            # Each row updates the shared LiveCandle in place, so handle it
+            # before the generator parses the next row for the same key
+            for live in self._extract_candles_from_message(data):
+                candle = live.to_candle(self.market)
                 await self._candle_queue.put(candle)
-                await self._persist_candle(candle)
-                await self._publish_candle(candle)
+                await self._persist_live_candle(live)
+                if publish:
+                    await self._publish_candle(candle)
         
         except json.JSONDecodeError:
             logger.warning(f"Invalid JSON message: {raw_message[:100]}")
         except Exception as e:
             logger.error(f"Error processing message: {e}")
     
-    def _parse_binance_kline(self, data: dict) -> Optional[Candle]:
-        """Parse Binance kline payload to Candle."""
+    def _live_candle(self, symbol: str, interval: str) -> LiveCandle:
+        """Get (or create) the in-flight candle for a symbol/interval."""
+        key = f"{symbol}:{interval}"
+        live = self._live_candles.get(key)
+        if live is None:
+            live = self._live_candles[key] = LiveCandle(symbol=symbol, interval=interval)
+        return live
+
+    def _parse_binance_kline(self, data: dict) -> Optional[LiveCandle]:
+        """Parse Binance kline payload into the live candle registry."""
         try:
             k = data.get("k", {})
             
-            return Candle(
-                market=Market.CRYPTO,
-                symbol=k.get("s", ""),
-                timestamp=datetime.fromtimestamp(k.get("t", 0) / 1000, tz=timezone.utc),
-                open=Decimal(str(k.get("o", "0"))),
-                high=Decimal(str(k.get("h", "0"))),
-                low=Decimal(str(k.get("l", "0"))),
-                close=Decimal(str(k.get("c", "0"))),
-                volume=Decimal(str(k.get("v", "0"))),
-                quote_volume=Decimal(str(k.get("q", "0"))),
-                trades=k.get("n", 0),
-                interval=k.get("i", "1m"),
-                is_closed=k.get("x", False),
-            )
+            live = self._live_candle(k.get("s", ""), k.get("i", "1m"))
+            live.start_ms = int(k.get("t", 0))
+            live.open = str(k.get("o", "0"))
+            live.high = str(k.get("h", "0"))
+            live.low = str(k.get("l", "0"))
+            live.close = str(k.get("c", "0"))
+            live.volume = str(k.get("v", "0"))
+            live.quote_volume = str(k.get("q", "0"))
+            live.trades = k.get("n", 0)
+            live.is_closed = k.get("x", False)
+            return live
         except Exception as e:
             logger.error(f"Error parsing kline: {e}")
             return None
 
-    def _parse_bybit_kline(self, data: dict) -> Optional[Candle]:
-        """Parse Bybit kline payload to Candle."""
+    def _parse_bybit_kline(self, data: dict) -> Optional[LiveCandle]:
+        """Parse Bybit kline payload into the live candle registry."""
         try:
             interval_raw = str(data.get("interval", "1"))
             interval = self.BYBIT_TO_INTERNAL_INTERVAL.get(interval_raw, f"{interval_raw}m")
@@ -228,19 +239,16 @@ class CryptoDataFeed(DataFeedProvider):
             if start_ms == 0:
                 return None
 
-            return Candle(
-                market=Market.CRYPTO,
-                symbol=str(data.get("symbol", "")),
-                timestamp=datetime.fromtimestamp(start_ms / 1000, tz=timezone.utc),
-                open=Decimal(str(data.get("open", "0"))),
-                high=Decimal(str(data.get("high", "0"))),
-                low=Decimal(str(data.get("low", "0"))),
-                close=Decimal(str(data.get("close", "0"))),
-                volume=Decimal(str(data.get("volume", "0"))),
-                quote_volume=Decimal(str(data.get("turnover", "0"))),
-                interval=interval,
-                is_closed=bool(data.get("confirm", False)),
-            )
+            live = self._live_candle(str(data.get("symbol", "")), interval)
+            live.start_ms = start_ms
+            live.open = str(data.get("open", "0"))
+            live.high = str(data.get("high", "0"))
+            live.low = str(data.get("low", "0"))
+            live.close = str(data.get("close", "0"))
+            live.volume = str(data.get("volume", "0"))
+            live.quote_volume = str(data.get("turnover", "0"))
+            live.is_closed = bool(data.get("confirm", False))
+            return live
         except Exception as e:
             logger.error(f"Error parsing Bybit kline: {e}")
             return None
@@ -276,29 +284,32 @@ class CryptoDataFeed(DataFeedProvider):
             return subscription.endswith(f".{symbol.upper()}")
         return subscription.startswith(symbol.lower())
 
-    def _extract_candles_from_message(self, data: dict) -> List[Candle]:
-        """Extract candles from raw websocket message."""
-        candles: List[Candle] = []
-
+    def _extract_candles_from_message(self, data: dict) -> Iterator[LiveCandle]:
+        """
+        Parse kline rows from a raw websocket message, one at a time.
+        
+        Rows for the same symbol/interval (e.g. Bybit's closing confirm row
+        followed by the next open row) update one shared LiveCandle, so each
+        yielded candle must be consumed before iterating further.
+        """
         if self.exchange == "bybit":
             topic = str(data.get("topic", ""))
             if not topic.startswith("kline."):
-                return candles
+                return
             payload = data.get("data", [])
             if isinstance(payload, list):
                 for row in payload:
                     candle = self._parse_bybit_kline(cast(dict, row))
                     if candle:
-                        candles.append(candle)
-            return candles
+                        yield candle
+            return
 
         if "stream" in data and "data" in data:
             stream = str(data["stream"])
             if "@kline_" in stream:
                 candle = self._parse_binance_kline(cast(dict, data["data"]))
                 if candle:
-                    candles.append(candle)
-        return candles
+                    yield candle
     
     async def _persist_candle(self, candle: Candle) -> None:
         """Persist candle to QuestDB (skipped in standalone mode)."""
@@ -310,36 +321,71 @@ class CryptoDataFeed(DataFeedProvider):
         if settings.standalone_mode:
             return
         
+        self._write_candle_line(
+            symbol=candle.symbol,
+            fields={
+                "open": float(candle.open),
+                "high": float(candle.high),
+                "low": float(candle.low),
+                "close": float(candle.close),
+                "volume": float(candle.volume),
+                "quote_volume": float(candle.quote_volume) if candle.quote_volume else 0,
+                "trades": candle.trades or 0,
+            },
+            timestamp_ns=int(candle.timestamp.timestamp() * 1_000_000_000),
+        )
+    
+    async def _persist_live_candle(self, live: LiveCandle) -> None:
+        """Persist a closed live candle straight from its raw fields."""
+        if not live.is_closed:
+            return  # Only persist closed candles
+        
+        # Skip if standalone mode (no QuestDB)
+        settings = get_settings()
+        if settings.standalone_mode:
+            return
+        
+        self._write_candle_line(
+            symbol=live.symbol,
+            fields={
+                "open": float(live.open),
+                "high": float(live.high),
+                "low": float(live.low),
+                "close": float(live.close),
+                "volume": float(live.volume),
+                "quote_volume": float(live.quote_volume),
+                "trades": live.trades or 0,
+            },
+            timestamp_ns=live.timestamp_ns,
+        )
+    
+    def _write_candle_line(self, symbol: str, fields: dict, timestamp_ns: int) -> None:
+        """Write a candle row to QuestDB via ILP."""
         try:
             questdb = get_questdb()
             questdb.write_line(
                 table="candles",
                 tags={
-                    "market": candle.market.value,
-                    "symbol": candle.symbol,
+                    "market": self.market.value,
+                    "symbol": symbol,
                 },
-                fields={
-                    "open": float(candle.open),
-                    "high": float(candle.high),
-                    "low": float(candle.low),
-                    "close": float(candle.close),
-                    "volume": float(candle.volume),
-                    "quote_volume": float(candle.quote_volume) if candle.quote_volume else 0,
-                    "trades": candle.trades or 0,
-                },
-                timestamp_ns=int(candle.timestamp.timestamp() * 1_000_000_000),
+                fields=fields,
+                timestamp_ns=timestamp_ns,
             )
         except Exception as e:
             logger.error(f"Error persisting candle: {e}")
     
-    async def _publish_candle(self, candle: Candle) -> None:
-        """Publish candle to NATS (skipped in standalone mode)."""
+    def _publish_enabled(self) -> bool:
+        """Return True when candles should be published to NATS."""
         if ensure_connected is None or Subjects is None:
-            return
+            return False
 
         # Skip if standalone mode (no NATS)
-        settings = get_settings()
-        if settings.standalone_mode:
+        return not get_settings().standalone_mode
+
+    async def _publish_candle(self, candle: Candle) -> None:
+        """Publish candle to NATS (skipped in standalone mode)."""
+        if not self._publish_enabled():
             return
 
         try:
@@ -347,6 +393,7 @@ class CryptoDataFeed(DataFeedProvider):
             await messaging.publish(
                 Subjects.candles(self.market.value),
                 candle,
+                reliability="core",
             )
         except Exception as e:
             logger.error(f"Error publishing candle: {e}")
@@ -8,6 +8,7 @@ Extension point for future brokers:
 - Bybit, OKX (Crypto futures)
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from decimal import Decimal
 from typing import Callable, List, Optional
@@ -21,8 +22,17 @@ class BrokerAdapter(ABC):
     
     All execution logic is delegated to market-specific
     adapters that implement this interface.
+    
+    Subclasses declare their own __slots__ for any attributes they add.
     """
     
+    __slots__ = (
+        "_market",
+        "_connected",
+        "_on_fill_callback",
+        "_on_order_update_callback",
+    )
+    
     def __init__(self, market: Market) -> None:
         """
         Initialize broker adapter.
@@ -134,14 +144,24 @@ class BrokerAdapter(ABC):
         pass
     
     async def start(self) -> None:
-        """Start the broker adapter."""
-        await self.connect()
+        """
+        Start the broker adapter.
+        
+        If the starting task is cancelled mid-connect, any half-open
+        connection is torn down so the connected flag never disagrees
+        with the actual connection state.
+        """
+        try:
+            await self.connect()
+        except asyncio.CancelledError:
+            await asyncio.shield(self.disconnect())
+            raise
         self._connected = True
     
     async def stop(self) -> None:
-        """Stop the broker adapter."""
+        """Stop the broker adapter (disconnect is shielded from cancellation)."""
         self._connected = False
-        await self.disconnect()
+        await asyncio.shield(self.disconnect())
 
 
 class OrderError(Exception):
@@ -5,18 +5,32 @@ Simulates order execution using fill_logic.py.
 
 import asyncio
 import logging
-from datetime import datetime
+import random
+from collections import deque
+from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import Dict, List, Optional
-from uuid import uuid4
+from typing import Callable, Deque, Dict, Iterator, List, Optional, Tuple
 
 from shared.fill_logic import FillResult, get_fill_simulator
-from shared.models import Fill, Market, Order, OrderStatus, TradingMode
+from shared.models import (
+    PRICE_SCALE,
+    QTY_SCALE,
+    Fill,
+    Market,
+    Order,
+    OrderSide,
+    OrderStatus,
+    OrderType,
+    TradingMode,
+)
 
 from .base import BrokerAdapter, OrderError
 
 logger = logging.getLogger(__name__)
 
+# Cash flow direction per side: buys spend notional, sells receive it
+_SIDE_SIGN: Dict[OrderSide, int] = {OrderSide.BUY: -1, OrderSide.SELL: 1}
+
 
 class BrokerStub(BrokerAdapter):
     """
@@ -24,13 +38,41 @@ class BrokerStub(BrokerAdapter):
     
     Uses fill_logic.py for realistic fill simulation
     with slippage, latency, and fees.
+    
+    The balance is tracked internally as an int in PRICE_SCALE minor
+    units; Decimal is only used at the API boundary.
     """
     
+    __slots__ = (
+        "_balance",
+        "_random_seed",
+        "_simulator",
+        "_open_orders",
+        "_open_by_symbol",
+        "_order_history",
+        "_order_index",
+        "_fills",
+        "_last_prices",
+        "_order_seq",
+        "_simulate_latency",
+        "_virtual_now",
+        "_on_fill_batch_callback",
+        "_on_order_update_batch_callback",
+        "_pending_fills",
+        "_pending_order_updates",
+        "_flush_handle",
+    )
+    
+    # Window over which batched callbacks are coalesced
+    CALLBACK_BATCH_WINDOW_S = 0.005
+    
     def __init__(
         self,
         market: Market,
         initial_balance: Decimal = Decimal("100000"),
         random_seed: Optional[int] = None,
+        simulate_latency: bool = False,
+        max_history: Optional[int] = 100_000,
     ) -> None:
         """
         Initialize broker stub.
@@ -39,14 +81,34 @@ class BrokerStub(BrokerAdapter):
             market: Market scope
             initial_balance: Starting balance
             random_seed: Seed for reproducible fills
+            simulate_latency: Sleep for simulated latency (real-time paper
+                trading); when False a virtual clock is advanced instead
+            max_history: Most recent fills / completed orders to keep
+                in memory (None for unbounded)
         """
         super().__init__(market)
-        self._balance = initial_balance
+        self._balance = self._to_minor(initial_balance, PRICE_SCALE)
         self._random_seed = random_seed
+        self._simulator = get_fill_simulator(random_seed)
         self._open_orders: Dict[str, Order] = {}  # order_id -> order
-        self._order_history: List[Order] = []
-        self._fills: List[Fill] = []
+        self._open_by_symbol: Dict[str, Dict[str, Order]] = {}  # symbol -> order_id -> order
+        self._order_history: Deque[Order] = deque(maxlen=max_history)
+        self._order_index: Dict[str, Order] = {}  # order_id -> completed order
+        self._fills: Deque[Fill] = deque(maxlen=max_history)
         self._last_prices: Dict[str, Decimal] = {}
+        self._order_seq = 0  # Monotonic counter for external IDs
+        self._simulate_latency = simulate_latency
+        self._virtual_now = datetime.min
+        self._on_fill_batch_callback: Optional[Callable[[List[Fill]], None]] = None
+        self._on_order_update_batch_callback: Optional[Callable[[List[Order]], None]] = None
+        self._pending_fills: List[Fill] = []
+        self._pending_order_updates: List[Order] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+    
+    @staticmethod
+    def _to_minor(value: Decimal, scale: int) -> int:
+        """Convert a Decimal amount to int minor units."""
+        return int(value * scale)
     
     async def connect(self) -> None:
         """Connect (no-op for stub)."""
@@ -58,6 +120,52 @@ class BrokerStub(BrokerAdapter):
         logger.info("BrokerStub disconnected")
         self._connected = False
     
+    def set_on_fill_batch_callback(self, callback: Callable[[List[Fill]], None]) -> None:
+        """
+        Set a batched fill callback.
+        
+        Fills are then coalesced over CALLBACK_BATCH_WINDOW_S and
+        delivered as one list instead of through the per-fill callback.
+        """
+        self._on_fill_batch_callback = callback
+    
+    def set_on_order_update_batch_callback(self, callback: Callable[[List[Order]], None]) -> None:
+        """Set a batched order update callback (see set_on_fill_batch_callback)."""
+        self._on_order_update_batch_callback = callback
+    
+    def _emit_fill(self, fill: Fill) -> None:
+        """Deliver a fill to the batched or per-fill callback."""
+        if self._on_fill_batch_callback:
+            self._pending_fills.append(fill)
+            self._schedule_flush()
+        elif self._on_fill_callback:
+            self._on_fill_callback(fill)
+    
+    def _emit_order_update(self, order: Order) -> None:
+        """Deliver an order update to the batched or per-order callback."""
+        if self._on_order_update_batch_callback:
+            self._pending_order_updates.append(order)
+            self._schedule_flush()
+        elif self._on_order_update_callback:
+            self._on_order_update_callback(order)
+    
+    def _schedule_flush(self) -> None:
+        """Arm the batch flush timer if it is not already pending."""
+        if self._flush_handle is None:
+            loop = asyncio.get_running_loop()
+            self._flush_handle = loop.call_later(self.CALLBACK_BATCH_WINDOW_S, self._flush_callbacks)
+    
+    def _flush_callbacks(self) -> None:
+        """Deliver all pending fills and order updates as batches."""
+        self._flush_handle = None
+        fills, self._pending_fills = self._pending_fills, []
+        orders, self._pending_order_updates = self._pending_order_updates, []
+        
+        if fills and self._on_fill_batch_callback:
+            self._on_fill_batch_callback(fills)
+        if orders and self._on_order_update_batch_callback:
+            self._on_order_update_batch_callback(orders)
+    
     def set_price(self, symbol: str, price: Decimal) -> None:
         """
         Update last price for a symbol.
@@ -68,30 +176,65 @@ class BrokerStub(BrokerAdapter):
     
     async def submit_order(self, order: Order) -> Order:
         """Submit order for simulated execution."""
-        # Assign external ID
-        order.external_id = f"STUB-{uuid4().hex[:8]}"
-        order.status = OrderStatus.SUBMITTED
-        order.submitted_at = datetime.utcnow()
-        order.updated_at = datetime.utcnow()
-        
-        logger.info(f"Order submitted: {order.side} {order.quantity} {order.symbol} @ {order.order_type}")
-        
-        # Store in open orders
-        self._open_orders[str(order.id)] = order
+        self._accept_order(order, datetime.utcnow())
         
         # Simulate immediate fill for market orders
-        if order.order_type.value == "market":
+        if order.order_type == OrderType.MARKET:
             await self._execute_fill(order)
         
         # Notify callback
-        if self._on_order_update_callback:
-            self._on_order_update_callback(order)
+        self._emit_order_update(order)
         
         return order
     
-    async def _execute_fill(self, order: Order) -> None:
-        """Execute a fill simulation."""
-        # Get market price
+    async def submit_orders_batch(self, orders: List[Order]) -> List[Order]:
+        """
+        Submit many orders at once (backtest fast path).
+        
+        Market orders are filled together through
+        FillSimulator.simulate_fills_batch(), and the batch waits once
+        for the slowest simulated latency instead of sleeping per order.
+        """
+        to_fill: List[Order] = []
+        market_prices: List[Decimal] = []
+        now = datetime.utcnow()  # One submit timestamp for the whole batch
+        
+        for order in orders:
+            self._accept_order(order, now)
+            if order.order_type == OrderType.MARKET:
+                market_price = self._resolve_market_price(order)
+                if market_price is not None:
+                    to_fill.append(order)
+                    market_prices.append(market_price)
+        
+        if to_fill:
+            self._reseed()
+            results = self._simulator.simulate_fills_batch(to_fill, market_prices)
+            
+            # Orders in a batch execute concurrently
+            filled_at = await self._wait_latency(max(r.latency_ms for r in results), since=now)
+            for order, result in zip(to_fill, results):
+                self._apply_fill(order, result, filled_at)
+        
+        for order in orders:
+            self._emit_order_update(order)
+        
+        return orders
+    
+    def _accept_order(self, order: Order, now: datetime) -> None:
+        """Assign an external ID and register the order as open."""
+        self._order_seq += 1
+        order.external_id = f"STUB-{self._order_seq:08x}"
+        order.status = OrderStatus.SUBMITTED
+        order.submitted_at = order.updated_at = now
+        
+        logger.info(f"Order submitted: {order.side} {order.quantity} {order.symbol} @ {order.order_type}")
+        
+        # Store in open orders
+        self._add_open_order(order)
+    
+    def _resolve_market_price(self, order: Order) -> Optional[Decimal]:
+        """Get the fill reference price, rejecting the order if there is none."""
         market_price = self._last_prices.get(order.symbol)
         if market_price is None:
             logger.warning(f"No price available for {order.symbol}, using order price")
@@ -100,34 +243,69 @@ class BrokerStub(BrokerAdapter):
         if market_price <= 0:
             order.status = OrderStatus.REJECTED
             order.error_message = "No valid price available"
+            return None
+        
+        return market_price
+    
+    def _reseed(self) -> None:
+        """
+        Re-seed the random module before a fill simulation.
+        
+        A seeded stub used to build a freshly seeded simulator per fill;
+        keep those per-call draws so seeded runs stay reproducible.
+        """
+        if self._random_seed is not None:
+            random.seed(self._random_seed)
+    
+    async def _execute_fill(self, order: Order) -> None:
+        """Execute a fill simulation."""
+        market_price = self._resolve_market_price(order)
+        if market_price is None:
             return
         
         # Simulate fill
-        simulator = get_fill_simulator(self._random_seed)
-        result = simulator.simulate_fill(order, market_price)
+        self._reseed()
+        result = self._simulator.simulate_fill(order, market_price)
         
         # Apply latency delay (async simulation)
-        await asyncio.sleep(result.latency_ms / 1000.0)
+        now = await self._wait_latency(result.latency_ms, since=order.submitted_at)
+        
+        self._apply_fill(order, result, now)
+    
+    async def _wait_latency(self, latency_ms: int, since: datetime) -> datetime:
+        """
+        Apply simulated latency and return the fill timestamp.
         
+        Sleeps in real time when simulating latency; otherwise advances
+        the virtual clock to `since + latency` without blocking.
+        """
+        if self._simulate_latency:
+            await asyncio.sleep(latency_ms / 1000.0)
+            return datetime.utcnow()
+        
+        self._virtual_now = max(self._virtual_now, since) + timedelta(milliseconds=latency_ms)
+        return self._virtual_now
+    
+    def _apply_fill(self, order: Order, result: FillResult, now: datetime) -> None:
+        """Book a simulated fill: order state, balance, history, callbacks."""
         # Update order
         order.filled_quantity = order.quantity
         order.status = OrderStatus.FILLED
-        order.filled_at = datetime.utcnow()
-        order.updated_at = datetime.utcnow()
+        order.filled_at = order.updated_at = now
         
         # Update balance
-        notional = result.fill.quantity * result.executed_price
-        if order.side.value == "buy":
-            self._balance -= notional + result.commission
-        else:
-            self._balance += notional - result.commission
+        px_i = self._to_minor(result.executed_price, PRICE_SCALE)
+        qty_i = self._to_minor(result.fill.quantity, QTY_SCALE)
+        notional_i = px_i * qty_i // QTY_SCALE
+        commission_i = self._to_minor(result.commission, PRICE_SCALE)
+        self._balance += _SIDE_SIGN[order.side] * notional_i - commission_i
         
         # Store fill
         self._fills.append(result.fill)
         
         # Remove from open orders
-        self._open_orders.pop(str(order.id), None)
-        self._order_history.append(order)
+        self._pop_open_order(order.id_str)
+        self._archive_order(order)
         
         logger.info(
             f"Order filled: {order.symbol} @ {result.executed_price} "
@@ -135,62 +313,80 @@ class BrokerStub(BrokerAdapter):
         )
         
         # Notify callbacks
-        if self._on_fill_callback:
-            self._on_fill_callback(result.fill)
-        if self._on_order_update_callback:
-            self._on_order_update_callback(order)
+        self._emit_fill(result.fill)
+        self._emit_order_update(order)
     
     async def cancel_order(self, order: Order) -> Order:
         """Cancel an open order."""
-        order_id = str(order.id)
+        order_id = order.id_str
         
         if order_id not in self._open_orders:
             raise OrderError("Order not found in open orders", order)
         
-        order = self._open_orders.pop(order_id)
+        order = self._pop_open_order(order_id)
         order.status = OrderStatus.CANCELLED
-        order.cancelled_at = datetime.utcnow()
-        order.updated_at = datetime.utcnow()
+        order.cancelled_at = order.updated_at = datetime.utcnow()
         
-        self._order_history.append(order)
+        self._archive_order(order)
         
         logger.info(f"Order cancelled: {order.id}")
         
-        if self._on_order_update_callback:
-            self._on_order_update_callback(order)
+        self._emit_order_update(order)
         
         return order
     
     async def get_order_status(self, order: Order) -> Order:
         """Get current order status."""
-        order_id = str(order.id)
+        order_id = order.id_str
         
         if order_id in self._open_orders:
             return self._open_orders[order_id]
         
         # Check history
-        for hist_order in self._order_history:
-            if str(hist_order.id) == order_id:
-                return hist_order
-        
-        return order
+        return self._order_index.get(order_id, order)
+    
+    def _archive_order(self, order: Order) -> None:
+        """Move a completed order into history and index it by id."""
+        if len(self._order_history) == self._order_history.maxlen:
+            # Oldest order is about to be evicted; keep the index bounded too
+            self._order_index.pop(self._order_history[0].id_str, None)
+        self._order_history.append(order)
+        self._order_index[order.id_str] = order
     
     async def get_open_orders(self, symbol: Optional[str] = None) -> List[Order]:
         """Get all open orders."""
-        orders = list(self._open_orders.values())
-        
         if symbol:
-            orders = [o for o in orders if o.symbol == symbol]
+            return list(self._open_by_symbol.get(symbol, {}).values())
         
-        return orders
+        return list(self._open_orders.values())
+    
+    def _add_open_order(self, order: Order) -> None:
+        """Register an order as open in both the id and symbol indexes."""
+        self._open_orders[order.id_str] = order
+        self._open_by_symbol.setdefault(order.symbol, {})[order.id_str] = order
+    
+    def _pop_open_order(self, order_id: str) -> Optional[Order]:
+        """Remove an order from the open-order indexes."""
+        order = self._open_orders.pop(order_id, None)
+        if order is not None:
+            by_symbol = self._open_by_symbol.get(order.symbol)
+            if by_symbol is not None:
+                by_symbol.pop(order_id, None)
+                if not by_symbol:
+                    del self._open_by_symbol[order.symbol]
+        return order
     
     async def get_account_balance(self) -> Decimal:
         """Get current balance."""
-        return self._balance
+        return Decimal(self._balance) / PRICE_SCALE
+    
+    def get_fills(self) -> Tuple[Fill, ...]:
+        """Get a snapshot of retained fills (the most recent `max_history`)."""
+        return tuple(self._fills)
     
-    def get_fills(self) -> List[Fill]:
-        """Get all fills."""
-        return self._fills.copy()
+    def iter_fills(self) -> Iterator[Fill]:
+        """Iterate retained fills without copying."""
+        return iter(self._fills)
     
     def reset(self, initial_balance: Optional[Decimal] = None) -> None:
         """
@@ -200,8 +396,16 @@ class BrokerStub(BrokerAdapter):
             initial_balance: New starting balance
         """
         if initial_balance:
-            self._balance = initial_balance
+            self._balance = self._to_minor(initial_balance, PRICE_SCALE)
         self._open_orders.clear()
+        self._open_by_symbol.clear()
         self._order_history.clear()
+        self._order_index.clear()
         self._fills.clear()
         self._last_prices.clear()
+        self._virtual_now = datetime.min
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._pending_fills.clear()
+        self._pending_order_updates.clear()
@@ -33,6 +33,30 @@ class CryptoBinanceAdapter(BrokerAdapter):
     and WebSocket for real-time fill updates.
     """
     
+    __slots__ = ("_testnet", "_client", "_bsm", "_user_socket")
+    
+    BINANCE_TO_STATUS: Dict[str, OrderStatus] = {
+        "NEW": OrderStatus.SUBMITTED,
+        "PARTIALLY_FILLED": OrderStatus.PARTIAL,
+        "FILLED": OrderStatus.FILLED,
+        "CANCELED": OrderStatus.CANCELLED,
+        "REJECTED": OrderStatus.REJECTED,
+        "EXPIRED": OrderStatus.CANCELLED,
+    }
+    BINANCE_TO_ORDER_TYPE: Dict[str, OrderType] = {
+        "MARKET": OrderType.MARKET,
+        "LIMIT": OrderType.LIMIT,
+        "STOP_LOSS": OrderType.STOP,
+        "STOP_LOSS_LIMIT": OrderType.STOP_LIMIT,
+    }
+    ORDER_TYPE_TO_BINANCE: Dict[OrderType, str] = {
+        value: key for key, value in BINANCE_TO_ORDER_TYPE.items()
+    }
+    
+    # Socket manager message buffer (library default is 100); large orders
+    # can emit bursts of partial-fill executionReports
+    USER_STREAM_MAX_QUEUE = 1000
+    
     def __init__(self, testnet: bool = True) -> None:
         """
         Initialize Binance adapter.
@@ -61,7 +85,10 @@ class CryptoBinanceAdapter(BrokerAdapter):
             )
             
             # Start user data stream for fill updates
-            self._bsm = BinanceSocketManager(self._client)
+            self._bsm = BinanceSocketManager(
+                self._client,
+                max_queue_size=self.USER_STREAM_MAX_QUEUE,
+            )
             self._user_socket = self._bsm.user_socket()
             
             # Start listening task
@@ -86,41 +113,77 @@ class CryptoBinanceAdapter(BrokerAdapter):
         logger.info("Disconnected from Binance")
     
     async def _listen_user_stream(self) -> None:
-        """Listen for user data stream events."""
+        """
+        Listen for user data stream events.
+        
+        A reader task pumps raw messages into a local queue; the consumer
+        blocks for the first message, then drains whatever else is already
+        queued and handles the whole burst in one pass.
+        """
         if not self._user_socket:
             return
         
+        queue: asyncio.Queue[Optional[dict]] = asyncio.Queue()
+        
         try:
             async with self._user_socket as stream:
-                while self._connected:
-                    msg = await stream.recv()
-                    await self._handle_user_event(msg)
+                reader = asyncio.create_task(self._pump_user_stream(stream, queue))
+                try:
+                    while self._connected:
+                        batch = [await queue.get()]
+                        while not queue.empty():
+                            batch.append(queue.get_nowait())
+                        
+                        stopped = None in batch  # Reader hit an error
+                        if stopped:
+                            batch = [msg for msg in batch if msg is not None]
+                        await self._handle_user_events(batch)
+                        if stopped:
+                            break
+                finally:
+                    reader.cancel()
         except Exception as e:
             logger.error(f"User stream error: {e}")
     
-    async def _handle_user_event(self, msg: dict) -> None:
-        """Handle user stream event."""
-        event_type = msg.get("e")
-        
-        if event_type == "executionReport":
-            await self._handle_execution_report(msg)
-    
-    async def _handle_execution_report(self, msg: dict) -> None:
-        """Handle order execution report."""
+    async def _pump_user_stream(self, stream, queue: asyncio.Queue[Optional[dict]]) -> None:
+        """Read user stream messages into the queue; None marks the end."""
         try:
-            # Parse fill from execution report
-            if msg.get("x") == "TRADE":  # Trade execution
+            while self._connected:
+                queue.put_nowait(await stream.recv())
+        except Exception as e:
+            logger.error(f"User stream error: {e}")
+        queue.put_nowait(None)
+    
+    async def _handle_user_events(self, msgs: List[dict]) -> None:
+        """Handle a burst of user stream events."""
+        reports = [msg for msg in msgs if msg.get("e") == "executionReport"]
+        if reports:
+            await self._handle_execution_reports_batch(reports)
+    
+    async def _handle_execution_reports_batch(self, msgs: List[dict]) -> None:
+        """Handle order execution reports, firing the fill callback per trade."""
+        mode = TradingMode.LIVE if not self._testnet else TradingMode.PAPER
+        
+        for msg in msgs:
+            try:
+                m = msg.get
+                
+                # Parse fill from execution report
+                if m("x") != "TRADE":  # Trade executions only
+                    continue
+                
+                # Binance sends amounts as decimal strings; Decimal parses them directly
                 fill = Fill(
                     market=Market.CRYPTO,
-                    order_id=msg.get("c"),  # Client order ID
-                    external_id=str(msg.get("t")),  # Trade ID
-                    mode=TradingMode.LIVE if not self._testnet else TradingMode.PAPER,
-                    symbol=msg.get("s"),
-                    side=OrderSide.BUY if msg.get("S") == "BUY" else OrderSide.SELL,
-                    quantity=Decimal(str(msg.get("l", "0"))),
-                    price=Decimal(str(msg.get("L", "0"))),
-                    commission=Decimal(str(msg.get("n", "0"))),
-                    commission_asset=msg.get("N"),
+                    order_id=m("c"),  # Client order ID
+                    external_id=str(m("t")),  # Trade ID
+                    mode=mode,
+                    symbol=m("s"),
+                    side=OrderSide.BUY if m("S") == "BUY" else OrderSide.SELL,
+                    quantity=Decimal(m("l") or "0"),
+                    price=Decimal(m("L") or "0"),
+                    commission=Decimal(m("n") or "0"),
+                    commission_asset=m("N"),
                     slippage_bps=Decimal("0"),  # Calculate from order price
                     latency_ms=0,
                 )
@@ -128,8 +191,8 @@ class CryptoBinanceAdapter(BrokerAdapter):
                 if self._on_fill_callback:
                     self._on_fill_callback(fill)
                     
-        except Exception as e:
-            logger.error(f"Error handling execution report: {e}")
+            except Exception as e:
+                logger.error(f"Error handling execution report: {e}")
     
     async def submit_order(self, order: Order) -> Order:
         """Submit order to Binance."""
@@ -138,20 +201,15 @@ class CryptoBinanceAdapter(BrokerAdapter):
         
         try:
             # Map order type
-            binance_type = {
-                OrderType.MARKET: "MARKET",
-                OrderType.LIMIT: "LIMIT",
-                OrderType.STOP: "STOP_LOSS",
-                OrderType.STOP_LIMIT: "STOP_LOSS_LIMIT",
-            }.get(order.order_type, "MARKET")
+            binance_type = self.ORDER_TYPE_TO_BINANCE.get(order.order_type, "MARKET")
             
             # Build order params
             params = {
                 "symbol": order.symbol,
-                "side": order.side.value.upper(),
+                "side": "BUY" if order.side == OrderSide.BUY else "SELL",
                 "type": binance_type,
                 "quantity": str(order.quantity),
-                "newClientOrderId": str(order.id),
+                "newClientOrderId": order.id_str,
             }
             
             if order.order_type == OrderType.LIMIT and order.price:
@@ -190,7 +248,7 @@ class CryptoBinanceAdapter(BrokerAdapter):
         try:
             await self._client.cancel_order(
                 symbol=order.symbol,
-                origClientOrderId=str(order.id),
+                origClientOrderId=order.id_str,
             )
             
             order.status = OrderStatus.CANCELLED
@@ -213,7 +271,7 @@ class CryptoBinanceAdapter(BrokerAdapter):
         try:
             result = await self._client.get_order(
                 symbol=order.symbol,
-                origClientOrderId=str(order.id),
+                origClientOrderId=order.id_str,
             )
             
             order.status = self._map_status(result.get("status", "NEW"))
@@ -273,26 +331,12 @@ class CryptoBinanceAdapter(BrokerAdapter):
         except BinanceAPIException:
             return Decimal("0")
     
-    @staticmethod
-    def _map_status(binance_status: str) -> OrderStatus:
+    @classmethod
+    def _map_status(cls, binance_status: str) -> OrderStatus:
         """Map Binance status to OrderStatus."""
-        mapping = {
-            "NEW": OrderStatus.SUBMITTED,
-            "PARTIALLY_FILLED": OrderStatus.PARTIAL,
-            "FILLED": OrderStatus.FILLED,
-            "CANCELED": OrderStatus.CANCELLED,
-            "REJECTED": OrderStatus.REJECTED,
-            "EXPIRED": OrderStatus.CANCELLED,
-        }
-        return mapping.get(binance_status, OrderStatus.PENDING)
+        return cls.BINANCE_TO_STATUS.get(binance_status, OrderStatus.PENDING)
     
-    @staticmethod
-    def _map_order_type(binance_type: str) -> OrderType:
+    @classmethod
+    def _map_order_type(cls, binance_type: str) -> OrderType:
         """Map Binance order type to OrderType."""
-        mapping = {
-            "MARKET": OrderType.MARKET,
-            "LIMIT": OrderType.LIMIT,
-            "STOP_LOSS": OrderType.STOP,
-            "STOP_LOSS_LIMIT": OrderType.STOP_LIMIT,
-        }
-        return mapping.get(binance_type, OrderType.MARKET)
+        return cls.BINANCE_TO_ORDER_TYPE.get(binance_type, OrderType.MARKET)
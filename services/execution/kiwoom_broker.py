@@ -16,12 +16,19 @@ Note:
 """
 
 import asyncio
+import concurrent.futures
+import importlib.util
 import logging
+import queue
 import sys
 import threading
+import weakref
+from collections import OrderedDict
 from datetime import datetime
 from decimal import Decimal
-from typing import Dict, List, Optional
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
 
 from shared.config import get_settings
 from shared.models import (
@@ -38,29 +45,87 @@ from .base import BrokerAdapter, OrderError
 
 logger = logging.getLogger(__name__)
 
-# Kiwoom OpenAPI+ 사용을 위한 조건부 임포트
-_KIWOOM_AVAILABLE = False
-try:
-    from PyQt5.QAxContainer import QAxWidget
-    from PyQt5.QtCore import QEventLoop, QTimer
-    from PyQt5.QtWidgets import QApplication
-
-    _KIWOOM_AVAILABLE = True
-except ImportError:
-    try:
-        from PySide2.QtAxContainer import QAxWidget
-        from PySide2.QtCore import QEventLoop, QTimer
-        from PySide2.QtWidgets import QApplication
-
-        _KIWOOM_AVAILABLE = True
-    except ImportError:
-        QAxWidget = None  # type: ignore
-        QApplication = None  # type: ignore
-        logger.warning(
-            "PyQt5/PySide2가 설치되지 않았습니다. "
-            "키움 OpenAPI+를 사용하려면 pip install PyQt5 를 실행하세요."
+def _find_qt_binding() -> Optional[str]:
+    """설치된 Qt 바인딩 이름 (임포트하지 않고 모듈 존재만 확인)."""
+    for package, ax_module in (("PyQt5", "QAxContainer"), ("PySide2", "QtAxContainer")):
+        try:
+            if importlib.util.find_spec(f"{package}.{ax_module}") is not None:
+                return package
+        except ImportError:
+            continue
+    return None
+
+
+# Kiwoom OpenAPI+ 사용을 위한 Qt 바인딩 확인 (실제 임포트는 _import_qt()에서 지연 수행)
+_QT_BINDING = _find_qt_binding()
+_KIWOOM_AVAILABLE = _QT_BINDING is not None
+if not _KIWOOM_AVAILABLE:
+    logger.warning(
+        "PyQt5/PySide2가 설치되지 않았습니다. "
+        "키움 OpenAPI+를 사용하려면 pip install PyQt5 를 실행하세요."
+    )
+
+QAxWidget = None  # type: ignore
+QApplication = None  # type: ignore
+
+
+def _import_qt() -> None:
+    """Qt 바인딩을 처음 필요할 때 임포트하여 모듈 전역에 저장."""
+    global QAxWidget, QApplication
+    if QApplication is not None:
+        return
+
+    if _QT_BINDING == "PyQt5":
+        from PyQt5.QAxContainer import QAxWidget as ax_widget
+        from PyQt5.QtWidgets import QApplication as application
+    elif _QT_BINDING == "PySide2":
+        from PySide2.QtAxContainer import QAxWidget as ax_widget
+        from PySide2.QtWidgets import QApplication as application
+    else:
+        raise OrderError(
+            "키움 OpenAPI+ 사용 불가: PyQt5/PySide2를 설치하세요. "
+            "(pip install PyQt5)"
         )
 
+    QAxWidget, QApplication = ax_widget, application
+
+
+# 추적 중이 아닌 주문의 체결에 사용하는 order_id (nil UUID)
+_UNKNOWN_ORDER_ID = UUID(int=0)
+
+# 체결 매도수구분 코드 (1:매도, 2:매수)
+_SIDE_SELL = "1"
+
+# 주문 유형 → 키움 호가구분 ("00"=지정가, "03"=시장가; 그 외 유형은 시장가로 전송)
+_HOGA_BY_ORDER_TYPE = {
+    OrderType.MARKET: "03",
+    OrderType.LIMIT: "00",
+    OrderType.STOP: "03",
+    OrderType.STOP_LIMIT: "03",
+}
+
+# 매수/매도 → 키움 주문유형 (1=신규매수, 2=신규매도, 3=매수취소, 4=매도취소)
+_ORDER_TYPE_BY_SIDE = {OrderSide.BUY: 1, OrderSide.SELL: 2}
+_CANCEL_TYPE_BY_SIDE = {OrderSide.BUY: 3, OrderSide.SELL: 4}
+
+# dynamicCall 시그니처 (호출마다 문자열을 새로 만들지 않도록 모듈 상수로 고정)
+_SIG_COMM_CONNECT = sys.intern("CommConnect()")
+_SIG_SET_INPUT_VALUE = sys.intern("SetInputValue(QString, QString)")
+_SIG_COMM_RQ_DATA = sys.intern("CommRqData(QString, QString, int, QString)")
+_SIG_GET_COMM_DATA = sys.intern("GetCommData(QString, QString, int, QString)")
+_SIG_GET_REPEAT_CNT = sys.intern("GetRepeatCnt(QString, QString)")
+_SIG_GET_CHEJAN_DATA = sys.intern("GetChejanData(int)")
+_SIG_GET_LOGIN_INFO = sys.intern("GetLoginInfo(QString)")
+_SIG_SEND_ORDER = sys.intern(
+    "SendOrder(QString, QString, QString, int, QString, int, int, QString, QString)"
+)
+
+
+@lru_cache(maxsize=4096)
+def _to_decimal(value: str) -> Decimal:
+    """숫자 문자열 → Decimal (부분 체결마다 같은 가격/수량 문자열이 반복되므로 캐시)."""
+    return Decimal(value)
+
 
 class KiwoomOpenAPI:
     """
@@ -70,6 +135,20 @@ class KiwoomOpenAPI:
     이 클래스는 Qt 이벤트 루프가 동작하는 스레드에서 실행되어야 합니다.
     """
 
+    __slots__ = (
+        "_ocx",
+        "_connected",
+        "_login_future",
+        "_chejan_callback",
+        "_get_chejan",
+        "_pending_tr",
+        "_pending_tr_lock",
+        "_order_args",
+    )
+
+    # 주문체결 FID: 주문번호, 종목코드, 주문상태, 체결량, 체결가, 매도수구분
+    CHEJAN_FILL_FIDS = (9203, 9001, 913, 911, 910, 905)
+
     CYCLED_EVENTS = {
         "OnReceiveTrData",
         "OnReceiveRealData",
@@ -85,18 +164,22 @@ class KiwoomOpenAPI:
                 "키움 OpenAPI+ 사용 불가: PyQt5/PySide2를 설치하세요. "
                 "(pip install PyQt5)"
             )
+        _import_qt()
 
         self._ocx: Optional[QAxWidget] = None
         self._connected = False
-        self._login_event = threading.Event()
-        self._tr_event = threading.Event()
-        self._order_event = threading.Event()
+        self._login_future: Optional[concurrent.futures.Future] = None
+
+        # 체결 데이터 콜백 (어댑터와 순환 참조가 생기지 않도록 WeakMethod로 보관)
+        self._chejan_callback: Optional[weakref.WeakMethod] = None
+        self._get_chejan = None  # create_control()에서 바인딩되는 GetChejanData 호출
 
-        # 체결 데이터 콜백
-        self._chejan_callback = None
+        # TR 요청 테이블: rq_name -> (Future, 조회 필드)
+        self._pending_tr: Dict[str, Tuple[concurrent.futures.Future, Tuple[str, ...]]] = {}
+        self._pending_tr_lock = threading.Lock()
 
-        # TR 응답 저장
-        self._tr_data: Dict[str, list] = {}
+        # SendOrder 인자 버퍼 (send_order는 Qt 스레드에서만 호출되므로 재사용)
+        self._order_args: List[Any] = [None] * 9
 
     def create_control(self) -> None:
         """OCX 컨트롤 생성 및 이벤트 연결."""
@@ -105,24 +188,27 @@ class KiwoomOpenAPI:
         self._ocx.OnReceiveTrData.connect(self._on_receive_tr_data)
         self._ocx.OnReceiveChejanData.connect(self._on_receive_chejan_data)
         self._ocx.OnReceiveMsg.connect(self._on_receive_msg)
+        self._get_chejan = partial(self._ocx.dynamicCall, _SIG_GET_CHEJAN_DATA)
         logger.info("키움 OpenAPI+ OCX 컨트롤 생성 완료")
 
-    def login(self, timeout: int = 60) -> bool:
+    def request_login(self) -> concurrent.futures.Future:
         """
-        키움 로그인 (CommConnect).
+        키움 로그인 요청 (CommConnect).
         로그인 창이 뜨며 사용자가 직접 로그인해야 합니다.
+
+        호출 즉시 반환하므로 Qt 스레드는 로그인 대기 중에도 다른 작업을 처리합니다.
+        asyncio에서는 asyncio.wrap_future()로 결과를 기다립니다.
+
+        Returns:
+            OnEventConnect 수신 시 로그인 성공 여부(bool)로 완료되는 Future
         """
         if self._ocx is None:
             raise OrderError("OCX 컨트롤이 생성되지 않았습니다.")
 
-        self._login_event.clear()
-        self._ocx.dynamicCall("CommConnect()")
-
-        # 로그인 완료 대기
-        if not self._login_event.wait(timeout=timeout):
-            raise OrderError("키움 로그인 시간 초과")
-
-        return self._connected
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        self._login_future = future
+        self._ocx.dynamicCall(_SIG_COMM_CONNECT)
+        return future
 
     def _on_event_connect(self, err_code: int) -> None:
         """로그인 완료 이벤트."""
@@ -132,7 +218,10 @@ class KiwoomOpenAPI:
         else:
             self._connected = False
             logger.error(f"키움 로그인 실패 (에러코드: {err_code})")
-        self._login_event.set()
+
+        future, self._login_future = self._login_future, None
+        if future is not None and not future.done():
+            future.set_result(self._connected)
 
     def _on_receive_msg(self, screen_no: str, rq_name: str, tr_code: str, msg: str) -> None:
         """서버 메시지 수신."""
@@ -147,9 +236,69 @@ class KiwoomOpenAPI:
         prev_next: str,
         *args,
     ) -> None:
-        """TR 데이터 수신 이벤트."""
+        """TR 데이터 수신 이벤트 (rq_name으로 대기 중인 요청을 찾아 완료)."""
         logger.debug(f"TR 수신: {tr_code} ({rq_name})")
-        self._tr_event.set()
+
+        with self._pending_tr_lock:
+            pending = self._pending_tr.pop(rq_name, None)
+        if pending is None:
+            return
+
+        future, fields = pending
+        try:
+            # GetCommData는 이 이벤트 안에서만 유효하므로 여기서 파싱
+            row_count = max(self.get_repeat_cnt(tr_code, record_name), 1)
+            rows = [
+                {field: self.get_comm_data(tr_code, record_name, i, field) for field in fields}
+                for i in range(row_count)
+            ]
+            future.set_result({"rows": rows, "prev_next": prev_next})
+        except Exception as e:
+            future.set_exception(e)
+
+    def request_tr(
+        self,
+        rq_name: str,
+        tr_code: str,
+        screen_no: str,
+        inputs: Dict[str, str],
+        fields: Tuple[str, ...],
+        prev_next: int = 0,
+    ) -> concurrent.futures.Future:
+        """
+        TR 조회 요청 (CommRqData).
+
+        rq_name별로 Future를 등록하므로 여러 TR을 동시에 요청할 수 있습니다.
+        asyncio에서는 asyncio.wrap_future()로 결과를 기다립니다.
+
+        Returns:
+            {"rows": [{field: value}, ...], "prev_next": str} 로 완료되는 Future
+        """
+        if self._ocx is None:
+            raise OrderError("OCX 컨트롤이 생성되지 않았습니다.")
+
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        with self._pending_tr_lock:
+            if rq_name in self._pending_tr:
+                raise OrderError(f"이미 처리 중인 TR 요청입니다: {rq_name}")
+            self._pending_tr[rq_name] = (future, fields)
+
+        for key, value in inputs.items():
+            self._ocx.dynamicCall(_SIG_SET_INPUT_VALUE, key, value)
+
+        ret = self._ocx.dynamicCall(
+            _SIG_COMM_RQ_DATA,
+            rq_name,
+            tr_code,
+            prev_next,
+            screen_no,
+        )
+        if ret != 0:
+            with self._pending_tr_lock:
+                self._pending_tr.pop(rq_name, None)
+            future.set_exception(OrderError(f"TR 요청 실패 ({tr_code}): 에러코드 {ret}"))
+
+        return future
 
     def _on_receive_chejan_data(self, gubun: str, item_cnt: int, fid_list: str) -> None:
         """
@@ -158,41 +307,49 @@ class KiwoomOpenAPI:
         gubun: "0" = 주문체결, "1" = 잔고변경, "4" = 파생잔고
         """
         if gubun == "0":
-            # 주문 체결 데이터 파싱
-            order_no = self._get_chejan_data(9203)    # 주문번호
-            symbol = self._get_chejan_data(9001)       # 종목코드
-            order_status = self._get_chejan_data(913)  # 주문상태
-            filled_qty = self._get_chejan_data(911)    # 체결량
-            filled_price = self._get_chejan_data(910)  # 체결가
-            side_code = self._get_chejan_data(905)     # 매도수구분 (1:매도, 2:매수)
+            # 주문 체결 데이터 파싱 (매도수구분 1:매도, 2:매수)
+            (
+                order_no,
+                symbol,
+                order_status,
+                filled_qty,
+                filled_price,
+                side_code,
+            ) = self._get_chejan_batch(self.CHEJAN_FILL_FIDS)
 
             logger.info(
                 f"체결: {symbol} {order_no} 상태={order_status} "
                 f"체결량={filled_qty} 체결가={filled_price}"
             )
 
-            if self._chejan_callback and filled_qty and filled_price:
+            callback = self._chejan_callback() if self._chejan_callback is not None else None
+            if callback is not None and filled_qty and filled_price:
                 try:
+                    # 국내 종목코드는 선두에만 "A"가 붙으므로 앞 한 글자만 제거
+                    symbol = symbol.strip() if symbol else ""
+                    if symbol.startswith("A"):
+                        symbol = symbol[1:]
                     fill_data = {
                         "order_no": order_no.strip() if order_no else "",
-                        "symbol": symbol.strip().replace("A", "") if symbol else "",
+                        "symbol": symbol,
                         "status": order_status.strip() if order_status else "",
                         "filled_qty": filled_qty.strip() if filled_qty else "0",
                         "filled_price": filled_price.strip() if filled_price else "0",
-                        "side": "sell" if side_code and side_code.strip() == "1" else "buy",
+                        "side": "sell" if side_code and side_code.strip() == _SIDE_SELL else "buy",
                     }
-                    self._chejan_callback(fill_data)
+                    callback(fill_data)
                 except Exception as e:
                     logger.error(f"체결 콜백 처리 오류: {e}")
 
-    def _get_chejan_data(self, fid: int) -> str:
-        """체결 데이터 FID 값 조회."""
-        return self._ocx.dynamicCall("GetChejanData(int)", fid)
+    def _get_chejan_batch(self, fids: tuple[int, ...]) -> tuple[str, ...]:
+        """여러 FID 값을 바인딩된 호출 하나로 연속 조회."""
+        get_chejan = self._get_chejan
+        return tuple(get_chejan(fid) for fid in fids)
 
     def get_comm_data(self, tr_code: str, record_name: str, index: int, item_name: str) -> str:
         """TR 응답에서 데이터 조회."""
         return self._ocx.dynamicCall(
-            "GetCommData(QString, QString, int, QString)",
+            _SIG_GET_COMM_DATA,
             tr_code,
             record_name,
             index,
@@ -201,9 +358,7 @@ class KiwoomOpenAPI:
 
     def get_repeat_cnt(self, tr_code: str, record_name: str) -> int:
         """TR 반복 횟수 조회."""
-        return self._ocx.dynamicCall(
-            "GetRepeatCnt(QString, QString)", tr_code, record_name
-        )
+        return self._ocx.dynamicCall(_SIG_GET_REPEAT_CNT, tr_code, record_name)
 
     def send_order(
         self,
@@ -223,17 +378,16 @@ class KiwoomOpenAPI:
         order_type: 1=신규매수, 2=신규매도, 3=매수취소, 4=매도취소, 5=매수정정, 6=매도정정
         hoga_type: "00"=지정가, "03"=시장가, "05"=조건부지정가, "06"=최유리지정가
         """
-        ret = self._ocx.dynamicCall(
-            "SendOrder(QString, QString, QString, int, QString, int, int, QString, QString)",
-            [rq_name, screen_no, account, order_type, symbol, qty, price, hoga_type, org_order_no],
-        )
+        args = self._order_args
+        args[:] = (rq_name, screen_no, account, order_type, symbol, qty, price, hoga_type, org_order_no)
+        ret = self._ocx.dynamicCall(_SIG_SEND_ORDER, args)
         if ret != 0:
             logger.error(f"주문 전송 실패: 에러코드 {ret}")
         return ret
 
     def get_login_info(self, tag: str) -> str:
         """로그인 정보 조회 (ACCNO, USER_ID, USER_NAME 등)."""
-        return self._ocx.dynamicCall("GetLoginInfo(QString)", tag)
+        return self._ocx.dynamicCall(_SIG_GET_LOGIN_INFO, tag)
 
     def get_account_list(self) -> list[str]:
         """계좌 목록 조회."""
@@ -258,14 +412,43 @@ class KiwoomBrokerAdapter(BrokerAdapter):
     - 동시 접속 제한 (1 OCX per process)
     """
 
+    __slots__ = (
+        "_settings",
+        "_api",
+        "_qt_app",
+        "_qt_thread",
+        "_qt_tasks",
+        "_qt_stop",
+        "_account",
+        "_open_orders",
+        "_recent_terminal",
+        "_fill_progress",
+        "__weakref__",
+    )
+
+    # 완료(체결/취소) 주문 보관 개수 상한
+    TERMINAL_ORDER_CAP = 10_000
+
+    # 로그인 창에서 사용자 입력을 기다리는 최대 시간
+    LOGIN_TIMEOUT_S = 90
+
+    # Qt 스레드 작업 큐 폴링 간격 (작업이 몰리면 최소값, 유휴 시 최대값까지 증가)
+    QT_POLL_MIN_S = 0.001
+    QT_POLL_MAX_S = 0.005
+
     def __init__(self) -> None:
         super().__init__(Market.KR)
         self._settings = get_settings().kiwoom
         self._api: Optional[KiwoomOpenAPI] = None
         self._qt_app: Optional[QApplication] = None
         self._qt_thread: Optional[threading.Thread] = None
+        self._qt_tasks: queue.Queue[Tuple[Callable[..., Any], tuple, concurrent.futures.Future]] = queue.Queue()
+        self._qt_stop = threading.Event()
         self._account: str = ""
-        self._order_map: Dict[str, Order] = {}  # order_no -> Order
+        self._open_orders: Dict[str, Order] = {}  # order_no -> 미체결 Order
+        self._recent_terminal: OrderedDict[str, Order] = OrderedDict()  # order_no -> 최근 완료 Order
+        # order_no -> [누적 체결수량, 주문수량] (KRX 수량은 정수이므로 int로 집계)
+        self._fill_progress: Dict[str, List[int]] = {}
 
     async def connect(self) -> None:
         """키움 OpenAPI+ 연결 (별도 Qt 스레드에서 로그인)."""
@@ -278,11 +461,18 @@ class KiwoomBrokerAdapter(BrokerAdapter):
         if sys.platform != "win32":
             raise OrderError("키움 OpenAPI+는 Windows에서만 사용할 수 있습니다.")
 
+        # Qt 스레드 시작 전에 바인딩을 임포트 (실패 시 여기서 OrderError)
+        _import_qt()
+
         logger.info("키움 OpenAPI+ 연결 중...")
 
-        # Qt 스레드에서 OCX 생성 및 로그인
-        loop = asyncio.get_event_loop()
-        connected = await loop.run_in_executor(None, self._connect_sync)
+        # 전용 Qt 스레드에서 OCX 생성 및 로그인 요청 (완료는 Qt 스레드를 점유하지 않고 대기)
+        self._start_qt_thread()
+        login_future = await self._call_qt(self._connect_sync)
+        try:
+            connected = await asyncio.wait_for(asyncio.wrap_future(login_future), self.LOGIN_TIMEOUT_S)
+        except asyncio.TimeoutError:
+            raise OrderError("키움 로그인 시간 초과")
 
         if not connected:
             raise OrderError("키움 OpenAPI+ 연결 실패")
@@ -290,7 +480,7 @@ class KiwoomBrokerAdapter(BrokerAdapter):
         # 계좌번호 설정
         self._account = self._settings.account_number
         if not self._account and self._api:
-            accounts = self._api.get_account_list()
+            accounts = await self._call_qt(self._api.get_account_list)
             if accounts:
                 self._account = accounts[0]
                 logger.info(f"자동 선택된 계좌: {self._account}")
@@ -298,21 +488,85 @@ class KiwoomBrokerAdapter(BrokerAdapter):
         self._connected = True
         logger.info(f"키움 OpenAPI+ 연결 완료 (계좌: {self._account})")
 
-    def _connect_sync(self) -> bool:
-        """동기적 연결 (Qt 스레드용)."""
-        if QApplication is None:
-            return False
+    def _start_qt_thread(self) -> None:
+        """OCX를 소유하는 전용 Qt 스레드 시작 (이미 실행 중이면 무시)."""
+        if self._qt_thread is not None and self._qt_thread.is_alive():
+            return
+
+        self._qt_stop.clear()
+        self._qt_thread = threading.Thread(
+            target=self._qt_worker,
+            name="kiwoom-qt",
+            daemon=True,
+        )
+        self._qt_thread.start()
 
-        # QApplication이 없으면 생성
-        if QApplication.instance() is None:
-            self._qt_app = QApplication(sys.argv)
+    def _qt_worker(self) -> None:
+        """
+        Qt 스레드 메인 루프.
+
+        작업 큐의 OCX 호출을 순서대로 실행하고, 그 사이 Qt 이벤트를 처리합니다.
+        작업이 몰릴 때는 즉시 연속 처리하고, 유휴 시에는 대기 간격을
+        QT_POLL_MAX_S까지 점진적으로 늘려 CPU 낭비를 줄입니다.
+        루프 오류로 스레드가 죽지 않으며, 종료 시 남은 작업은 OrderError로 실패 처리합니다.
+        """
+        try:
+            # QApplication이 없으면 생성
+            if QApplication.instance() is None:
+                self._qt_app = QApplication(sys.argv)
 
+            poll_s = self.QT_POLL_MIN_S
+            while not self._qt_stop.is_set():
+                try:
+                    try:
+                        func, args, future = self._qt_tasks.get(timeout=poll_s)
+                    except queue.Empty:
+                        QApplication.processEvents()
+                        poll_s = min(poll_s * 2, self.QT_POLL_MAX_S)
+                        continue
+
+                    poll_s = self.QT_POLL_MIN_S
+                    if future.set_running_or_notify_cancel():
+                        try:
+                            future.set_result(func(*args))
+                        except BaseException as e:
+                            future.set_exception(e)
+                    QApplication.processEvents()
+                except Exception as e:
+                    logger.error(f"Qt 스레드 처리 오류: {e}")
+        finally:
+            self._fail_pending_qt_tasks()
+
+    def _fail_pending_qt_tasks(self) -> None:
+        """큐에 남은 OCX 호출을 모두 OrderError로 실패 처리."""
+        while True:
+            try:
+                _, _, future = self._qt_tasks.get_nowait()
+            except queue.Empty:
+                return
+            if future.set_running_or_notify_cancel():
+                future.set_exception(OrderError("키움 Qt 스레드가 종료되었습니다."))
+
+    async def _call_qt(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Qt 스레드에서 func(*args)를 실행하고 결과를 기다림."""
+        thread = self._qt_thread
+        if thread is None or not thread.is_alive():
+            raise OrderError("키움 Qt 스레드가 실행 중이 아닙니다.")
+
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        self._qt_tasks.put((func, args, future))
+        if not thread.is_alive():
+            # put 직전에 스레드가 종료된 경우 대기 중인 작업이 남지 않도록 정리
+            self._fail_pending_qt_tasks()
+        return await asyncio.wrap_future(future)
+
+    def _connect_sync(self) -> concurrent.futures.Future:
+        """OCX 생성 및 로그인 요청 (Qt 스레드에서 실행, 로그인 완료 Future 반환)."""
         self._api = KiwoomOpenAPI()
         self._api.create_control()
-        self._api._chejan_callback = self._handle_chejan_sync
+        self._api._chejan_callback = weakref.WeakMethod(self._handle_chejan_sync)
 
-        # 로그인 (블로킹)
-        return self._api.login(timeout=90)
+        return self._api.request_login()
 
     def _handle_chejan_sync(self, fill_data: dict) -> None:
         """체결 데이터 처리 (동기 콜백)."""
@@ -325,23 +579,22 @@ class KiwoomBrokerAdapter(BrokerAdapter):
 
             if not filled_qty or filled_qty == "0":
                 return
+            filled_qty_int = int(filled_qty)
 
             side = OrderSide.BUY if side_str == "buy" else OrderSide.SELL
             mode = TradingMode.PAPER if self._settings.use_mock else TradingMode.LIVE
+            order = self._open_orders.get(order_no)
+            quantity = _to_decimal(filled_qty)
 
             fill = Fill(
                 market=Market.KR,
-                order_id=self._order_map.get(order_no, Order(
-                    market=Market.KR, mode=mode, symbol=symbol,
-                    side=side, order_type=OrderType.MARKET,
-                    quantity=Decimal(filled_qty), strategy_name="unknown",
-                )).id,
+                order_id=order.id if order is not None else _UNKNOWN_ORDER_ID,
                 external_id=order_no,
                 mode=mode,
                 symbol=symbol,
                 side=side,
-                quantity=Decimal(filled_qty),
-                price=Decimal(filled_price),
+                quantity=quantity,
+                price=_to_decimal(filled_price),
                 commission=Decimal("0"),  # 키움에서 별도 조회 필요
                 commission_asset="KRW",
                 slippage_bps=Decimal("0"),
@@ -352,15 +605,23 @@ class KiwoomBrokerAdapter(BrokerAdapter):
                 self._on_fill_callback(fill)
 
             # 주문 상태 업데이트
-            if order_no in self._order_map:
-                order = self._order_map[order_no]
-                order.filled_quantity += Decimal(filled_qty)
-                if order.filled_quantity >= order.quantity:
+            if order is not None:
+                now = datetime.utcnow()
+                progress = self._fill_progress.get(order_no)
+                if progress is None:
+                    progress = self._fill_progress[order_no] = [
+                        int(order.filled_quantity),
+                        int(order.quantity),
+                    ]
+                progress[0] += filled_qty_int
+                order.filled_quantity = Decimal(progress[0])
+                if progress[0] >= progress[1]:
                     order.status = OrderStatus.FILLED
-                    order.filled_at = datetime.utcnow()
+                    order.filled_at = now
+                    self._retire_order(order_no)
                 else:
                     order.status = OrderStatus.PARTIAL
-                order.updated_at = datetime.utcnow()
+                order.updated_at = now
 
                 if self._on_order_update_callback:
                     self._on_order_update_callback(order)
@@ -372,7 +633,16 @@ class KiwoomBrokerAdapter(BrokerAdapter):
         """키움 OpenAPI+ 연결 해제."""
         self._connected = False
         self._api = None
-        self._order_map.clear()
+        self._open_orders.clear()
+        self._recent_terminal.clear()
+        self._fill_progress.clear()
+
+        # Qt 스레드 종료
+        if self._qt_thread is not None:
+            self._qt_stop.set()
+            await asyncio.to_thread(self._qt_thread.join, 5)
+            self._qt_thread = None
+
         logger.info("키움 OpenAPI+ 연결 해제")
 
     async def submit_order(self, order: Order) -> Order:
@@ -381,26 +651,14 @@ class KiwoomBrokerAdapter(BrokerAdapter):
             raise OrderError("키움에 연결되어 있지 않습니다.", order)
 
         try:
-            # 주문 유형 매핑
-            if order.side == OrderSide.BUY:
-                kiwoom_order_type = 1  # 신규매수
-            else:
-                kiwoom_order_type = 2  # 신규매도
-
-            # 호가 유형 매핑
-            hoga_map = {
-                OrderType.MARKET: "03",  # 시장가
-                OrderType.LIMIT: "00",   # 지정가
-            }
-            hoga_type = hoga_map.get(order.order_type, "03")
+            kiwoom_order_type = _ORDER_TYPE_BY_SIDE[order.side]
+            hoga_type = _HOGA_BY_ORDER_TYPE[order.order_type]
 
             price = int(order.price) if order.price and order.order_type == OrderType.LIMIT else 0
             qty = int(order.quantity)
 
-            # 주문 발주 (별도 스레드에서)
-            loop = asyncio.get_event_loop()
-            ret = await loop.run_in_executor(
-                None,
+            # 주문 발주 (Qt 스레드에서)
+            ret = await self._call_qt(
                 self._api.send_order,
                 f"order_{order.id}",
                 "0101",  # 화면번호
@@ -439,12 +697,9 @@ class KiwoomBrokerAdapter(BrokerAdapter):
             raise OrderError("키움에 연결되어 있지 않습니다.", order)
 
         try:
-            # 취소 주문 유형: 3=매수취소, 4=매도취소
-            cancel_type = 3 if order.side == OrderSide.BUY else 4
+            cancel_type = _CANCEL_TYPE_BY_SIDE[order.side]
 
-            loop = asyncio.get_event_loop()
-            ret = await loop.run_in_executor(
-                None,
+            ret = await self._call_qt(
                 self._api.send_order,
                 f"cancel_{order.id}",
                 "0102",
@@ -461,8 +716,9 @@ class KiwoomBrokerAdapter(BrokerAdapter):
                 raise OrderError(f"키움 취소 실패 (에러코드: {ret})", order)
 
             order.status = OrderStatus.CANCELLED
-            order.cancelled_at = datetime.utcnow()
-            order.updated_at = datetime.utcnow()
+            order.cancelled_at = order.updated_at = datetime.utcnow()
+            if order.external_id:
+                self._retire_order(order.external_id)
 
             if self._on_order_update_callback:
                 self._on_order_update_callback(order)
@@ -477,9 +733,11 @@ class KiwoomBrokerAdapter(BrokerAdapter):
     async def get_order_status(self, order: Order) -> Order:
         """주문 상태 조회."""
         # 체결 이벤트에서 실시간 업데이트되므로
-        # _order_map에서 최신 상태를 반환
-        if order.external_id and order.external_id in self._order_map:
-            cached = self._order_map[order.external_id]
+        # 미체결/최근 완료 주문에서 최신 상태를 반환
+        cached = None
+        if order.external_id:
+            cached = self._open_orders.get(order.external_id) or self._recent_terminal.get(order.external_id)
+        if cached is not None:
             order.status = cached.status
             order.filled_quantity = cached.filled_quantity
             order.updated_at = cached.updated_at
@@ -487,21 +745,28 @@ class KiwoomBrokerAdapter(BrokerAdapter):
 
     async def get_open_orders(self, symbol: Optional[str] = None) -> List[Order]:
         """미체결 주문 목록 조회."""
-        open_orders = [
-            o for o in self._order_map.values()
-            if not o.is_terminal and (symbol is None or o.symbol == symbol)
-        ]
+        open_orders = list(self._open_orders.values())
+        if symbol is not None:
+            open_orders = [o for o in open_orders if o.symbol == symbol]
         return open_orders
 
+    def _retire_order(self, order_no: str) -> None:
+        """완료된 주문을 미체결 목록에서 최근 완료 목록으로 이동 (상한 초과 시 오래된 것부터 제거)."""
+        self._fill_progress.pop(order_no, None)
+        order = self._open_orders.pop(order_no, None)
+        if order is None:
+            return
+        self._recent_terminal[order_no] = order
+        if len(self._recent_terminal) > self.TERMINAL_ORDER_CAP:
+            self._recent_terminal.popitem(last=False)
+
     async def get_account_balance(self) -> Decimal:
         """예수금 조회."""
         if not self._api or not self._api.is_connected:
             return Decimal("0")
 
         try:
-            loop = asyncio.get_event_loop()
-            balance = await loop.run_in_executor(None, self._get_balance_sync)
-            return balance
+            return await self._call_qt(self._get_balance_sync)
         except Exception as e:
             logger.error(f"예수금 조회 실패: {e}")
             return Decimal("0")
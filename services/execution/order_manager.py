@@ -125,6 +125,7 @@ class OrderManager:
         """Stop order manager."""
         self._running = False
         await self._broker.stop()
+        await self._flush_order_events()
         logger.info("Order manager stopped")
     
     async def _on_signal_message(self, msg: Msg) -> None:
@@ -292,7 +293,7 @@ class OrderManager:
                             error_message = EXCLUDED.error_message
                     """),
                     {
-                        "id": str(order.id),
+                        "id": order.id_str,
                         "external_id": order.external_id,
                         "market": order.market.value,
                         "mode": order.mode.value,
@@ -363,7 +364,13 @@ class OrderManager:
             logger.error(f"Error persisting fill: {e}")
     
     async def _publish_order_event(self, order: Order, event_type: str) -> None:
-        """Publish order event to NATS (skipped in standalone mode)."""
+        """
+        Publish order event to NATS (skipped in standalone mode).
+        
+        Events are notifications of state already held by the broker and
+        database, so the order path does not wait for their JetStream acks;
+        failures are logged when the acks are collected.
+        """
         settings = get_settings()
         if settings.standalone_mode:
             return
@@ -377,13 +384,25 @@ class OrderManager:
                 event_type=event_type,
             )
             
-            await messaging.publish(
+            await messaging.publish_async(
                 subject=Subjects.orders(self._market.value),
                 data=event,
             )
         except Exception as e:
             logger.error(f"Error publishing order event: {e}")
     
+    async def _flush_order_events(self) -> None:
+        """Wait for outstanding order event acks (skipped in standalone mode)."""
+        settings = get_settings()
+        if settings.standalone_mode:
+            return
+        
+        try:
+            messaging = await ensure_connected()
+            await messaging.flush()
+        except Exception as e:
+            logger.error(f"Error flushing order events: {e}")
+    
     async def _publish_fill(self, fill: Fill) -> None:
         """Publish fill to NATS (skipped in standalone mode)."""
         settings = get_settings()
@@ -7,10 +7,11 @@ Extension point for: Telegram, Web dashboards
 
 import asyncio
 import logging
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
 from typing import Dict, Optional
 
-from shared.messaging import Subjects, ensure_connected
+from shared.messaging import NatsMessaging, Subjects, ensure_connected
 from shared.models import HealthStatus, Market
 
 logger = logging.getLogger(__name__)
@@ -21,9 +22,23 @@ class HealthMonitor:
     Service health monitoring.
     
     Publishes heartbeats to SYSTEM.HEALTH.*
-    for consumption by external dashboards.
+    for consumption by external dashboards. Heartbeats for all running
+    monitors are sent by one shared task (see HealthMonitorRegistry).
     """
     
+    __slots__ = (
+        "_service_name",
+        "_running",
+        "_start_time",
+        "_last_activity",
+        "_last_activity_monotonic",
+        "_last_published_activity",
+        "_status",
+        "_subject",
+        "_messaging",
+        "_status_template",
+    )
+    
     def __init__(self, service_name: str) -> None:
         """
         Initialize health monitor.
@@ -35,9 +50,13 @@ class HealthMonitor:
         self._running = False
         self._start_time: Optional[datetime] = None
         self._last_activity: Optional[datetime] = None
+        # Raw monotonic stamp from record_activity(); converted lazily on publish
+        self._last_activity_monotonic = 0.0
+        self._last_published_activity = 0.0
         self._status = "healthy"
-        self._heartbeat_task: Optional[asyncio.Task] = None
-        self._heartbeat_interval = 10  # seconds
+        self._subject = f"SYSTEM.HEALTH.{service_name.upper()}"
+        self._messaging: Optional[NatsMessaging] = None
+        self._status_template: Optional[HealthStatus] = None
     
     @property
     def service_name(self) -> str:
@@ -49,6 +68,11 @@ class HealthMonitor:
         """Get current status."""
         return self._status
     
+    @property
+    def is_running(self) -> bool:
+        """Check if the monitor is publishing heartbeats."""
+        return self._running
+    
     @property
     def uptime_seconds(self) -> int:
         """Get uptime in seconds."""
@@ -62,50 +86,46 @@ class HealthMonitor:
         self._running = True
         self._status = "healthy"
         
-        # Start heartbeat task
-        self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+        # Join the shared heartbeat task
+        _registry.attach(self)
         
         logger.info(f"Health monitor started for {self._service_name}")
     
     async def stop(self) -> None:
         """Stop health monitor."""
         self._running = False
-        
-        if self._heartbeat_task:
-            self._heartbeat_task.cancel()
-            try:
-                await self._heartbeat_task
-            except asyncio.CancelledError:
-                pass
+        await _registry.detach(self)
         
         logger.info(f"Health monitor stopped for {self._service_name}")
     
-    async def _heartbeat_loop(self) -> None:
-        """Background heartbeat publishing."""
-        while self._running:
-            try:
-                await self._publish_heartbeat()
-                await asyncio.sleep(self._heartbeat_interval)
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Heartbeat error: {e}")
-                await asyncio.sleep(self._heartbeat_interval)
-    
     async def _publish_heartbeat(self) -> None:
         """Publish health status heartbeat."""
         try:
-            messaging = await ensure_connected()
+            if self._messaging is None or not self._messaging.is_connected:
+                self._messaging = await ensure_connected()
             
-            status = HealthStatus(
-                service_name=self._service_name,
-                status=self._status,
-                uptime_seconds=self.uptime_seconds,
-                last_activity=self._last_activity,
-            )
+            if self._status_template is None:
+                # Validated once; later ticks copy it with updated fields
+                self._status_template = HealthStatus(
+                    service_name=self._service_name,
+                    status=self._status,
+                )
+            
+            if self._last_activity_monotonic > self._last_published_activity:
+                self._last_published_activity = self._last_activity_monotonic
+                self._last_activity = datetime.utcnow() - timedelta(
+                    seconds=time.monotonic() - self._last_activity_monotonic
+                )
+            
+            status = self._status_template.model_copy(update={
+                "status": self._status,
+                "timestamp": datetime.utcnow(),
+                "uptime_seconds": self.uptime_seconds,
+                "last_activity": self._last_activity,
+            })
             
-            await messaging.publish(
-                subject=f"SYSTEM.HEALTH.{self._service_name.upper()}",
+            await self._messaging.publish(
+                subject=self._subject,
                 data=status,
             )
             
@@ -113,8 +133,8 @@ class HealthMonitor:
             logger.error(f"Error publishing heartbeat: {e}")
     
     def record_activity(self) -> None:
-        """Record activity timestamp."""
-        self._last_activity = datetime.utcnow()
+        """Record activity timestamp (materialized on the next heartbeat)."""
+        self._last_activity_monotonic = time.monotonic()
     
     def set_status(self, status: str) -> None:
         """
@@ -138,12 +158,72 @@ class HealthMonitor:
         logger.error(f"Service unhealthy: {reason}")
 
 
+class HealthMonitorRegistry:
+    """
+    Per-service health monitors sharing a single heartbeat task.
+    
+    One background task wakes at aligned intervals and publishes
+    heartbeats for every running monitor concurrently, instead of
+    each monitor running its own timer loop.
+    """
+    
+    def __init__(self, heartbeat_interval: int = 10) -> None:
+        """
+        Initialize registry.
+        
+        Args:
+            heartbeat_interval: Seconds between heartbeat rounds
+        """
+        self._monitors: Dict[str, HealthMonitor] = {}
+        self._running: Dict[str, HealthMonitor] = {}
+        self._heartbeat_interval = heartbeat_interval
+        self._heartbeat_task: Optional[asyncio.Task] = None
+    
+    def get(self, service_name: str) -> HealthMonitor:
+        """Get or create health monitor for service."""
+        if service_name not in self._monitors:
+            self._monitors[service_name] = HealthMonitor(service_name)
+        return self._monitors[service_name]
+    
+    def attach(self, monitor: HealthMonitor) -> None:
+        """Include a started monitor in heartbeat rounds."""
+        self._running[monitor.service_name] = monitor
+        if self._heartbeat_task is None or self._heartbeat_task.done():
+            self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+    
+    async def detach(self, monitor: HealthMonitor) -> None:
+        """Remove a stopped monitor; stop the shared task when none remain."""
+        self._running.pop(monitor.service_name, None)
+        if self._running or self._heartbeat_task is None:
+            return
+        
+        self._heartbeat_task.cancel()
+        try:
+            await self._heartbeat_task
+        except asyncio.CancelledError:
+            pass
+        self._heartbeat_task = None
+    
+    async def _heartbeat_loop(self) -> None:
+        """Publish heartbeats for all running monitors at aligned deadlines."""
+        loop = asyncio.get_running_loop()
+        next_deadline = loop.time()
+        
+        while self._running:
+            try:
+                monitors = list(self._running.values())
+                await asyncio.gather(*(m._publish_heartbeat() for m in monitors))
+            except Exception as e:
+                logger.error(f"Heartbeat error: {e}")
+            
+            next_deadline += self._heartbeat_interval
+            await asyncio.sleep(max(0.0, next_deadline - loop.time()))
+
+
 # Global health monitors per service
-_health_monitors: Dict[str, HealthMonitor] = {}
+_registry = HealthMonitorRegistry()
 
 
 def get_health_monitor(service_name: str) -> HealthMonitor:
     """Get or create health monitor for service."""
-    if service_name not in _health_monitors:
-        _health_monitors[service_name] = HealthMonitor(service_name)
-    return _health_monitors[service_name]
+    return _registry.get(service_name)
@@ -0,0 +1,270 @@
+"""
+Fill Bus
+Single fill subscription shared by the risk engine components.
+
+PositionTracker and RiskManager both consume every fill for a market.
+The bus holds one durable subscription, decodes each fill once and
+hands it to every registered handler. The NATS message is acked once
+all handlers have acked their delivery, or nak'ed if any of them naks.
+A redelivered fill only goes to the handlers that have not acked it yet.
+
+Components register their handlers as they start; the service then calls
+FillBus.start() once, after all of them have registered, so no component
+misses fills that arrive (or are replayed) before it registers.
+
+Before the bus, each component had its own durable (position_tracker_<market>,
+risk_manager_<market>). When the bus durable is first created it starts
+right after the oldest legacy ack floor, skips fills a handler's legacy
+durable already acked, and deletes the legacy durables once it is past them.
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Set
+from uuid import UUID
+
+from nats.aio.msg import Msg
+
+from shared.messaging import NatsMessaging, Subjects, deserialize_message, ensure_connected
+from shared.models import Fill, Market
+
+logger = logging.getLogger(__name__)
+
+
+class _DeliveryGroup:
+    """Tracks handler outcomes for one NATS message."""
+    
+    __slots__ = ("_bus", "_fill_id", "_msg", "_pending", "_nak_delay", "_failed")
+    
+    def __init__(self, bus: "FillBus", fill_id: UUID, msg: Msg, pending: int) -> None:
+        self._bus = bus
+        self._fill_id = fill_id
+        self._msg = msg
+        self._pending = pending
+        self._nak_delay: Optional[float] = None
+        self._failed = False
+    
+    async def settle(
+        self,
+        handler: "FillHandler",
+        ok: bool,
+        delay: Optional[float] = None,
+    ) -> None:
+        """Record one handler outcome; ack/nak the message after the last."""
+        if ok:
+            self._bus._mark_handled(self._fill_id, handler)
+        else:
+            self._failed = True
+            if delay is not None:
+                self._nak_delay = max(self._nak_delay or 0, delay)
+        
+        self._pending -= 1
+        if self._pending:
+            return
+        
+        if self._failed:
+            await self._msg.nak(delay=self._nak_delay)
+        else:
+            self._bus._handled.pop(self._fill_id, None)
+            await self._msg.ack()
+
+
+class FillDelivery:
+    """
+    A decoded fill as seen by one bus handler.
+    
+    Exposes the same ack()/nak() calls as a NATS Msg, so handlers can
+    defer acknowledgement (e.g. until a batch is persisted).
+    """
+    
+    __slots__ = ("fill", "_group", "_handler", "_settled")
+    
+    def __init__(self, fill: Fill, group: _DeliveryGroup, handler: "FillHandler") -> None:
+        self.fill = fill
+        self._group = group
+        self._handler = handler
+        self._settled = False
+    
+    async def ack(self) -> None:
+        """Mark the fill as handled (ignored if already settled)."""
+        if self._settled:
+            return
+        self._settled = True
+        await self._group.settle(self._handler, True)
+    
+    async def nak(self, delay: Optional[float] = None) -> None:
+        """Request redelivery of the fill (ignored if already settled)."""
+        if self._settled:
+            return
+        self._settled = True
+        await self._group.settle(self._handler, False, delay)
+
+
+FillHandler = Callable[[FillDelivery], Coroutine[Any, Any, None]]
+
+
+class FillBus:
+    """
+    Per-market fill fan-out.
+    
+    Handlers should ack or nak their delivery once; later calls are
+    ignored, and a handler that raises before settling counts as a nak.
+    All handlers register before start(), which opens the subscription;
+    registering afterwards raises RuntimeError.
+    """
+    
+    # Fills with a partial outcome remembered for per-handler redelivery
+    HANDLED_FILL_MEMORY = 65536
+    
+    def __init__(self, market: Market) -> None:
+        """
+        Initialize fill bus.
+        
+        Args:
+            market: Market whose fills are consumed
+        """
+        self._market = market
+        self._subject = Subjects.fills(market.value)
+        self._durable = f"risk_engine_{market.value}"
+        self._handlers: List[FillHandler] = []
+        self._legacy_durables: Dict[FillHandler, str] = {}
+        self._subscribed = False
+        # fill id -> handlers that acked it while another handler nak'ed
+        self._handled: "OrderedDict[UUID, Set[FillHandler]]" = OrderedDict()
+        # legacy durable -> stream sequence it had acked when the bus took over
+        self._legacy_floors: Dict[str, int] = {}
+        # handler -> stream sequence its legacy durable already covers
+        self._skip_through: Dict[FillHandler, int] = {}
+    
+    @property
+    def is_started(self) -> bool:
+        """Check if the fill subscription is open."""
+        return self._subscribed
+    
+    def register(self, handler: FillHandler, legacy_durable: Optional[str] = None) -> None:
+        """
+        Add a handler (must happen before start()).
+        
+        Args:
+            handler: Fill handler
+            legacy_durable: Durable the handler consumed fills on before the bus
+        """
+        if self._subscribed:
+            raise RuntimeError(
+                f"Fill bus for {self._market.value} already started; "
+                "register handlers before FillBus.start()"
+            )
+        self._handlers.append(handler)
+        if legacy_durable is not None:
+            self._legacy_durables[handler] = legacy_durable
+    
+    def unregister(self, handler: FillHandler) -> None:
+        """Remove a handler."""
+        if handler in self._handlers:
+            self._handlers.remove(handler)
+        self._legacy_durables.pop(handler, None)
+        self._skip_through.pop(handler, None)
+    
+    async def start(self) -> None:
+        """Open the shared fill subscription for the registered handlers."""
+        if self._subscribed:
+            return
+        if not self._handlers:
+            raise RuntimeError(f"No fill handlers registered for {self._market.value}")
+        
+        self._subscribed = True
+        messaging = await ensure_connected()
+        start_seq = await self._load_legacy_floors(messaging)
+        for handler, name in self._legacy_durables.items():
+            if name in self._legacy_floors:
+                self._skip_through[handler] = self._legacy_floors[name]
+        
+        await messaging.subscribe(
+            subject=self._subject,
+            handler=self._on_fill_message,
+            durable=self._durable,
+            opt_start_seq=start_seq,
+        )
+        logger.info(f"Fill bus started for {self._market.value} with {len(self._handlers)} handlers")
+    
+    async def _load_legacy_floors(self, messaging: NatsMessaging) -> Optional[int]:
+        """Read legacy durable ack floors; return the bus start sequence."""
+        for name in (f"position_tracker_{self._market.value}", f"risk_manager_{self._market.value}"):
+            floor = await messaging.durable_ack_floor(self._subject, name)
+            if floor is not None:
+                self._legacy_floors[name] = floor
+        
+        if not self._legacy_floors:
+            return None
+        logger.info(f"Taking over fill durables {sorted(self._legacy_floors)} with {self._durable}")
+        return min(self._legacy_floors.values()) + 1
+    
+    async def _retire_legacy_durables(self) -> None:
+        """Delete legacy durables once the bus is past their ack floors."""
+        names, self._legacy_floors = list(self._legacy_floors), {}
+        self._skip_through.clear()
+        try:
+            messaging = await ensure_connected()
+            for name in names:
+                await messaging.delete_durable(self._subject, name)
+            logger.info(f"Deleted legacy fill durables {names}")
+        except Exception as e:
+            logger.error(f"Error deleting legacy fill durables: {e}")
+    
+    def _mark_handled(self, fill_id: UUID, handler: FillHandler) -> None:
+        """Remember that a handler acked a fill, forgetting the oldest beyond HANDLED_FILL_MEMORY."""
+        handled = self._handled.get(fill_id)
+        if handled is None:
+            handled = self._handled[fill_id] = set()
+            if len(self._handled) > self.HANDLED_FILL_MEMORY:
+                self._handled.popitem(last=False)
+        handled.add(handler)
+    
+    async def _on_fill_message(self, msg: Msg) -> None:
+        """Decode a fill once and dispatch it to the handlers still owing it."""
+        try:
+            fill = deserialize_message(msg.data, Fill)
+        except Exception as e:
+            logger.error(f"Error decoding fill: {e}")
+            await msg.nak(delay=5)
+            return
+        
+        if not self._handlers:
+            await msg.nak(delay=5)
+            return
+        
+        handled = self._handled.get(fill.id, ())
+        handlers = [handler for handler in self._handlers if handler not in handled]
+        if self._legacy_floors:
+            seq = msg.metadata.sequence.stream
+            handlers = [h for h in handlers if self._skip_through.get(h, 0) < seq]
+            if seq > max(self._legacy_floors.values()):
+                await self._retire_legacy_durables()
+        
+        if not handlers:
+            self._handled.pop(fill.id, None)
+            await msg.ack()
+            return
+        
+        group = _DeliveryGroup(self, fill.id, msg, len(handlers))
+        deliveries = [FillDelivery(fill, group, handler) for handler in handlers]
+        results = await asyncio.gather(
+            *(handler(delivery) for handler, delivery in zip(handlers, deliveries)),
+            return_exceptions=True,
+        )
+        for delivery, result in zip(deliveries, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error in fill handler: {result}")
+                await delivery.nak(delay=5)  # no-op if the handler already settled
+
+
+# Global fill buses per market
+_buses: Dict[Market, FillBus] = {}
+
+
+def get_fill_bus(market: Market) -> FillBus:
+    """Get or create the fill bus for a market."""
+    if market not in _buses:
+        _buses[market] = FillBus(market)
+    return _buses[market]
@@ -3,19 +3,104 @@ Position Tracker
 Real-time position aggregation and P&L calculation.
 """
 
+import asyncio
 import logging
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+from uuid import UUID
 
-from nats.aio.msg import Msg
+import numpy as np
+from sqlalchemy import text
 
 from shared.database import get_postgres
-from shared.messaging import Subjects, deserialize_message, ensure_connected
-from shared.models import Fill, Market, OrderSide, Position, TradingMode
+from shared.models import (
+    PRICE_SCALE,
+    QTY_SCALE,
+    Fill,
+    Market,
+    OrderSide,
+    Position,
+    TradingMode,
+)
+
+from .fill_bus import FillDelivery, get_fill_bus
 
 logger = logging.getLogger(__name__)
 
+# Magnitude at which int64 fixed-point values overflow
+_INT64_LIMIT = float(2**63)
+
+_LOAD_POSITIONS_SQL = text("""
+    SELECT * FROM positions
+    WHERE market = :market
+      AND mode = :mode
+      AND closed_at IS NULL
+""")
+
+_UPSERT_POSITION_SQL = text("""
+    INSERT INTO positions (
+        id, market, mode, symbol, side, quantity,
+        avg_entry_price, current_price, unrealized_pnl,
+        realized_pnl, strategy_name, opened_at, updated_at, closed_at
+    ) VALUES (
+        :id, :market, :mode, :symbol, :side, :quantity,
+        :avg_entry_price, :current_price, :unrealized_pnl,
+        :realized_pnl, :strategy_name, :opened_at, :updated_at, :closed_at
+    )
+    ON CONFLICT (id) DO UPDATE SET
+        quantity = EXCLUDED.quantity,
+        current_price = EXCLUDED.current_price,
+        unrealized_pnl = EXCLUDED.unrealized_pnl,
+        realized_pnl = EXCLUDED.realized_pnl,
+        updated_at = EXCLUDED.updated_at,
+        closed_at = EXCLUDED.closed_at
+""")
+
+
+@dataclass(slots=True)
+class _PositionTicks:
+    """
+    Fixed-point working copy of a Position's numeric fields.
+    
+    Prices and P&L are ints in PRICE_SCALE minor units, quantity in
+    QTY_SCALE units. The Decimal fields on Position are written back
+    from here only when a position is read or persisted. Unrealized
+    P&L and the mark price live in the tracker's SoA arrays at index ``row``.
+    """
+    is_long: bool
+    qty: int
+    avg_px: int
+    realized: int = 0
+    row: int = -1
+    
+    @classmethod
+    def from_position(cls, position: Position) -> "_PositionTicks":
+        """Build ticks from a (loaded or new) Position."""
+        return cls(
+            is_long=position.side is OrderSide.BUY,
+            qty=int(position.quantity * QTY_SCALE),
+            avg_px=int(position.avg_entry_price * PRICE_SCALE),
+            realized=int(position.realized_pnl * PRICE_SCALE),
+        )
+    
+    def pnl(self, exit_px: int, qty: int) -> int:
+        """P&L in PRICE_SCALE units for qty closed/marked at exit_px."""
+        diff = exit_px - self.avg_px if self.is_long else self.avg_px - exit_px
+        return diff * qty // QTY_SCALE
+    
+    def write_to(self, position: Position, price: int, unrealized: int) -> None:
+        """Materialize Decimal fields on the Position."""
+        position.quantity = Decimal(self.qty) / QTY_SCALE
+        position.avg_entry_price = Decimal(self.avg_px) / PRICE_SCALE
+        if price:
+            position.current_price = Decimal(price) / PRICE_SCALE
+        position.realized_pnl = Decimal(self.realized) / PRICE_SCALE
+        position.unrealized_pnl = Decimal(unrealized) / PRICE_SCALE
+
 
 class PositionTracker:
     """
@@ -25,8 +110,37 @@ class PositionTracker:
     - Average entry price
     - Unrealized P&L
     - Realized P&L
+    
+    Position math runs on fixed-point ints (_PositionTicks); the
+    Decimal fields are materialized on read and on persistence.
+    Open positions are also mirrored into structure-of-arrays rows
+    (quantity, average price, side, mark price, unrealized P&L) so totals
+    are a single NumPy reduction and update_prices() marks many symbols
+    in one vectorized pass.
+    Fills arriving within FILL_BATCH_WINDOW_S are applied together;
+    the touched positions are snapshotted onto a write-behind queue and
+    a writer task upserts them and acks the fills after the commit.
     """
     
+    # Fill micro-batching: collect window and max fills per batch
+    FILL_BATCH_WINDOW_S = 0.01
+    MAX_FILL_BATCH = 256
+    
+    # Write-behind: max queued fill batches, max batches per upsert
+    PERSIST_QUEUE_SIZE = 1024
+    MAX_PERSIST_BATCH = 64
+    PERSIST_RETRY_DELAY_S = 5  # redelivery delay for fills whose upsert failed
+    
+    # Recently applied fill ids remembered to drop redeliveries
+    APPLIED_FILL_MEMORY = 65536
+    
+    # Initial row capacity of the SoA arrays (doubled when full)
+    INITIAL_ROW_CAPACITY = 1024
+    
+    # Unrealized P&L is held in _unrl_arr at PRICE_SCALE // divisor. At full
+    # PRICE_SCALE int64 tops out near 9.2e10, which KRW P&L can reach.
+    UNREALIZED_SCALE_DIVISOR: Dict[Market, int] = {Market.KR: 10**6}
+    
     def __init__(
         self,
         market: Market,
@@ -43,7 +157,26 @@ class PositionTracker:
         self._mode = mode
         self._running = False
         self._positions: Dict[str, Position] = {}  # symbol -> position
+        self._ticks: Dict[str, _PositionTicks] = {}  # symbol -> fixed-point state
+        
+        # SoA mirror of open positions, row i <-> self._row_symbols[i]
+        self._row_symbols: List[str] = []
+        self._qty_arr = np.zeros(self.INITIAL_ROW_CAPACITY, dtype=np.int64)
+        self._avg_arr = np.zeros(self.INITIAL_ROW_CAPACITY, dtype=np.int64)
+        self._side_arr = np.zeros(self.INITIAL_ROW_CAPACITY, dtype=np.int8)
+        self._px_arr = np.zeros(self.INITIAL_ROW_CAPACITY, dtype=np.int64)
+        self._unrl_arr = np.zeros(self.INITIAL_ROW_CAPACITY, dtype=np.int64)
+        self._unrl_div = self.UNREALIZED_SCALE_DIVISOR.get(market, 1)
         self._last_prices: Dict[str, Decimal] = {}  # symbol -> last price
+        self._fill_queue: asyncio.Queue[Tuple[FillDelivery, Fill]] = asyncio.Queue()
+        self._flush_task: Optional[asyncio.Task] = None
+        # (position rows, fill deliveries to ack once the rows are committed)
+        self._persist_queue: asyncio.Queue[Tuple[List[dict], List[FillDelivery]]] = asyncio.Queue(
+            maxsize=self.PERSIST_QUEUE_SIZE
+        )
+        self._writer_task: Optional[asyncio.Task] = None
+        # fill id -> position it updated (oldest first, capped at APPLIED_FILL_MEMORY)
+        self._applied_fills: "OrderedDict[UUID, Optional[Position]]" = OrderedDict()
     
     @property
     def market(self) -> Market:
@@ -51,9 +184,11 @@ class PositionTracker:
         return self._market
     
     @property
-    def positions(self) -> Dict[str, Position]:
-        """Get current positions."""
-        return self._positions.copy()
+    def positions(self) -> Mapping[str, Position]:
+        """Get current positions (read-only live view)."""
+        for symbol, position in self._positions.items():
+            self._materialize(symbol, position)
+        return MappingProxyType(self._positions)
     
     async def start(self) -> None:
         """Start position tracker."""
@@ -62,20 +197,43 @@ class PositionTracker:
         # Load existing positions from database
         await self._load_positions()
         
-        # Subscribe to fills
-        messaging = await ensure_connected()
-        await messaging.subscribe(
-            subject=Subjects.fills(self._market.value),
-            handler=self._on_fill_message,
-            durable=f"position_tracker_{self._market.value}",
+        # Start batch processor before fills can arrive
+        self._running = True
+        self._flush_task = asyncio.create_task(self._flush_loop())
+        self._writer_task = asyncio.create_task(self._writer_loop())
+        
+        # Receive fills from the shared risk-engine subscription (they flow
+        # once the service calls get_fill_bus(market).start())
+        get_fill_bus(self._market).register(
+            self._on_fill,
+            legacy_durable=f"position_tracker_{self._market.value}",
         )
         
-        self._running = True
         logger.info(f"Position tracker started with {len(self._positions)} positions")
     
     async def stop(self) -> None:
         """Stop position tracker."""
         self._running = False
+        get_fill_bus(self._market).unregister(self._on_fill)
+        
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        
+        if self._writer_task:
+            # Write out snapshots still queued before shutting the writer down
+            await self._persist_queue.join()
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+            self._writer_task = None
+        
         logger.info("Position tracker stopped")
     
     async def _load_positions(self) -> None:
@@ -83,58 +241,181 @@ class PositionTracker:
         try:
             postgres = get_postgres()
             async with postgres.session() as session:
-                from sqlalchemy import text
-                
-                result = await session.execute(
-                    text("""
-                        SELECT * FROM positions
-                        WHERE market = :market
-                          AND mode = :mode
-                          AND closed_at IS NULL
-                    """),
+                result = await session.stream(
+                    _LOAD_POSITIONS_SQL,
                     {"market": self._market.value, "mode": self._mode.value}
                 )
                 
-                rows = result.mappings().all()
-                for row in rows:
+                # NUMERIC columns already arrive as Decimal from asyncpg
+                async for row in result.mappings():
                     position = Position(
                         id=row["id"],
                         market=Market(row["market"]),
                         mode=TradingMode(row["mode"]),
                         symbol=row["symbol"],
                         side=OrderSide(row["side"]),
-                        quantity=Decimal(str(row["quantity"])),
-                        avg_entry_price=Decimal(str(row["avg_entry_price"])),
-                        current_price=Decimal(str(row["current_price"])) if row["current_price"] else None,
-                        unrealized_pnl=Decimal(str(row["unrealized_pnl"])),
-                        realized_pnl=Decimal(str(row["realized_pnl"])),
+                        quantity=row["quantity"],
+                        avg_entry_price=row["avg_entry_price"],
+                        current_price=row["current_price"] or None,
+                        unrealized_pnl=row["unrealized_pnl"],
+                        realized_pnl=row["realized_pnl"],
                         strategy_name=row["strategy_name"],
                         opened_at=row["opened_at"],
                     )
                     self._positions[position.symbol] = position
+                    current = position.current_price
+                    self._track(
+                        position.symbol,
+                        _PositionTicks.from_position(position),
+                        int(current * PRICE_SCALE) if current is not None else 0,
+                        int(position.unrealized_pnl * PRICE_SCALE),
+                    )
                     
         except Exception as e:
             logger.error(f"Error loading positions: {e}")
     
-    async def _on_fill_message(self, msg: Msg) -> None:
-        """Handle fill message."""
+    async def _on_fill(self, delivery: FillDelivery) -> None:
+        """Handle fill from the bus (queued for the batch processor)."""
+        self._fill_queue.put_nowait((delivery, delivery.fill))
+    
+    async def _flush_loop(self) -> None:
+        """Drain queued fills in batches of up to MAX_FILL_BATCH."""
+        loop = asyncio.get_running_loop()
+        
+        while self._running:
+            batch = [await self._fill_queue.get()]
+            deadline = loop.time() + self.FILL_BATCH_WINDOW_S
+            
+            while len(batch) < self.MAX_FILL_BATCH:
+                if not self._fill_queue.empty():
+                    batch.append(self._fill_queue.get_nowait())
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._fill_queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            
+            try:
+                await self._process_fill_batch(batch)
+            except Exception as e:
+                logger.error(f"Error processing fill batch: {e}")
+    
+    async def _process_fill_batch(self, batch: List[Tuple[FillDelivery, Fill]]) -> None:
+        """
+        Apply a batch of fills and queue the touched positions for the writer.
+        
+        If anything fails before the batch is queued, every delivery in it
+        is nak'ed rather than left to time out.
+        
+        Args:
+            batch: (delivery, fill) pairs in arrival order
+        """
+        handed_off = False
         try:
-            fill = deserialize_message(msg.data, Fill)
-            await self._process_fill(fill)
-            await msg.ack()
-        except Exception as e:
-            logger.error(f"Error processing fill: {e}")
-            await msg.nak(delay=5)
+            applied: List[FillDelivery] = []
+            touched: Dict[str, Position] = {}
+            now = datetime.utcnow()  # one timestamp for the whole batch
+            
+            for msg, fill in batch:
+                if fill.id in self._applied_fills:
+                    # Redelivery (e.g. after a failed upsert): don't apply the
+                    # fill twice, just write its position again before acking
+                    position = self._applied_fills[fill.id]
+                else:
+                    try:
+                        position = self._apply_fill(fill, now)
+                    except Exception as e:
+                        logger.error(f"Error processing fill: {e}")
+                        await msg.nak(delay=5)
+                        continue
+                    self._remember_fill(fill.id, position)
+                applied.append(msg)
+                if position is not None:
+                    touched[str(position.id)] = position
+            
+            rows: List[dict] = []
+            for position in touched.values():
+                if self._positions.get(position.symbol) is position:
+                    self._materialize(position.symbol, position)
+                rows.append(self._position_row(position))
+            
+            if applied:
+                item = (rows, applied)
+                try:
+                    self._persist_queue.put_nowait(item)
+                except asyncio.QueueFull:
+                    await self._persist_queue.put(item)
+            handed_off = True
+        finally:
+            if not handed_off:
+                # The batch never reached the writer: release its deliveries
+                # for redelivery (ones already nak'ed ignore the repeat)
+                await asyncio.gather(
+                    *(msg.nak(delay=5) for msg, _ in batch),
+                    return_exceptions=True,
+                )
     
-    async def _process_fill(self, fill: Fill) -> None:
+    async def _writer_loop(self) -> None:
         """
-        Process fill and update position.
+        Upsert queued position snapshots, then settle the fills behind them.
+        
+        Fills are acked only after the upsert commits. If it fails they are
+        nak'ed so JetStream redelivers them; the redelivered fills are not
+        re-applied, only their positions are written again.
+        """
+        while True:
+            items = [await self._persist_queue.get()]
+            while len(items) < self.MAX_PERSIST_BATCH and not self._persist_queue.empty():
+                items.append(self._persist_queue.get_nowait())
+            
+            latest: Dict[str, dict] = {}  # position id -> newest snapshot
+            msgs: List[FillDelivery] = []
+            for rows, batch_msgs in items:
+                for row in rows:
+                    latest[row["id"]] = row
+                msgs.extend(batch_msgs)
+            
+            try:
+                if latest:
+                    await self._persist_positions_bulk(list(latest.values()))
+            except Exception as e:
+                logger.error(f"Error persisting positions: {e}")
+                settle = [msg.nak(delay=self.PERSIST_RETRY_DELAY_S) for msg in msgs]
+            else:
+                settle = [msg.ack() for msg in msgs]
+            
+            try:
+                await asyncio.gather(*settle)
+            except Exception as e:
+                logger.error(f"Error settling fills: {e}")
+            finally:
+                for _ in items:
+                    self._persist_queue.task_done()
+    
+    def _remember_fill(self, fill_id: UUID, position: Optional[Position]) -> None:
+        """Record an applied fill, forgetting the oldest beyond APPLIED_FILL_MEMORY."""
+        self._applied_fills[fill_id] = position
+        if len(self._applied_fills) > self.APPLIED_FILL_MEMORY:
+            self._applied_fills.popitem(last=False)
+    
+    def _apply_fill(self, fill: Fill, now: datetime) -> Optional[Position]:
+        """
+        Apply fill to in-memory position.
         
         Args:
-            fill: Fill to process
+            fill: Fill to apply
+            now: Batch timestamp for updated_at/closed_at
+            
+        Returns:
+            The updated open position, or None if the fill closed it
         """
         symbol = fill.symbol
         existing = self._positions.get(symbol)
+        fill_qty = int(fill.quantity * QTY_SCALE)
+        fill_px = int(fill.price * PRICE_SCALE)
         
         if existing is None:
             # New position
@@ -149,54 +430,45 @@ class PositionTracker:
                 strategy_name=fill.metadata.get("strategy_name", "unknown"),
             )
             self._positions[symbol] = position
+            self._track(
+                symbol,
+                _PositionTicks(is_long=fill.side is OrderSide.BUY, qty=fill_qty, avg_px=fill_px),
+                fill_px,
+            )
             
         else:
             # Update existing position
+            ticks = self._ticks[symbol]
+            unrealized = int(self._unrl_arr[ticks.row]) * self._unrl_div
             if fill.side == existing.side:
                 # Adding to position
-                total_cost = existing.quantity * existing.avg_entry_price + fill.quantity * fill.price
-                new_quantity = existing.quantity + fill.quantity
-                existing.avg_entry_price = total_cost / new_quantity
-                existing.quantity = new_quantity
+                new_qty = ticks.qty + fill_qty
+                ticks.avg_px = (ticks.qty * ticks.avg_px + fill_qty * fill_px) // new_qty
+                ticks.qty = new_qty
             else:
                 # Reducing/closing position
-                if fill.quantity >= existing.quantity:
+                if fill_qty >= ticks.qty:
                     # Close position
-                    realized_pnl = self._calculate_realized_pnl(existing, fill)
-                    existing.realized_pnl += realized_pnl
-                    existing.quantity = Decimal("0")
-                    existing.closed_at = datetime.utcnow()
+                    ticks.realized += ticks.pnl(fill_px, ticks.qty)
+                    ticks.qty = 0
+                    existing.closed_at = now
                     del self._positions[symbol]
+                    self._untrack(symbol)
                 else:
                     # Partial close
-                    realized_pnl = self._calculate_realized_pnl_partial(existing, fill)
-                    existing.realized_pnl += realized_pnl
-                    existing.quantity -= fill.quantity
+                    ticks.realized += ticks.pnl(fill_px, fill_qty)
+                    ticks.qty -= fill_qty
             
-            existing.current_price = fill.price
-            existing.updated_at = datetime.utcnow()
-        
-        # Persist position
-        if symbol in self._positions:
-            await self._persist_position(self._positions[symbol])
+            if symbol in self._ticks:
+                self._sync_row(ticks)
+                self._px_arr[ticks.row] = fill_px
+            ticks.write_to(existing, fill_px, unrealized)
+            existing.updated_at = now
         
-        logger.info(f"Position updated: {symbol} qty={self._positions.get(symbol, existing).quantity if symbol in self._positions else 0}")
-    
-    def _calculate_realized_pnl(self, position: Position, fill: Fill) -> Decimal:
-        """Calculate realized P&L for closing trade."""
-        if position.side == OrderSide.BUY:
-            # Long position closed
-            return (fill.price - position.avg_entry_price) * position.quantity
-        else:
-            # Short position closed
-            return (position.avg_entry_price - fill.price) * position.quantity
-    
-    def _calculate_realized_pnl_partial(self, position: Position, fill: Fill) -> Decimal:
-        """Calculate realized P&L for partial close."""
-        if position.side == OrderSide.BUY:
-            return (fill.price - position.avg_entry_price) * fill.quantity
-        else:
-            return (position.avg_entry_price - fill.price) * fill.quantity
+        position = self._positions.get(symbol)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Position updated: %s qty=%s", symbol, position.quantity if position is not None else 0)
+        return position
     
     def update_price(self, symbol: str, price: Decimal) -> None:
         """
@@ -208,61 +480,137 @@ class PositionTracker:
         """
         self._last_prices[symbol] = price
         
-        if symbol in self._positions:
-            position = self._positions[symbol]
-            position.current_price = price
-            
-            # Calculate unrealized P&L
-            if position.side == OrderSide.BUY:
-                position.unrealized_pnl = (price - position.avg_entry_price) * position.quantity
-            else:
-                position.unrealized_pnl = (position.avg_entry_price - price) * position.quantity
+        ticks = self._ticks.get(symbol)
+        if ticks is not None:
+            # Calculate unrealized P&L (Position fields are refreshed on read)
+            px = int(price * PRICE_SCALE)
+            self._px_arr[ticks.row] = px
+            self._unrl_arr[ticks.row] = ticks.pnl(px, ticks.qty) // self._unrl_div
     
-    async def _persist_position(self, position: Position) -> None:
-        """Persist position to database."""
-        try:
-            postgres = get_postgres()
-            async with postgres.session() as session:
-                from sqlalchemy import text
-                
-                await session.execute(
-                    text("""
-                        INSERT INTO positions (
-                            id, market, mode, symbol, side, quantity,
-                            avg_entry_price, current_price, unrealized_pnl,
-                            realized_pnl, strategy_name, opened_at, updated_at, closed_at
-                        ) VALUES (
-                            :id, :market, :mode, :symbol, :side, :quantity,
-                            :avg_entry_price, :current_price, :unrealized_pnl,
-                            :realized_pnl, :strategy_name, :opened_at, :updated_at, :closed_at
-                        )
-                        ON CONFLICT (id) DO UPDATE SET
-                            quantity = EXCLUDED.quantity,
-                            current_price = EXCLUDED.current_price,
-                            unrealized_pnl = EXCLUDED.unrealized_pnl,
-                            realized_pnl = EXCLUDED.realized_pnl,
-                            updated_at = EXCLUDED.updated_at,
-                            closed_at = EXCLUDED.closed_at
-                    """),
-                    {
-                        "id": str(position.id),
-                        "market": position.market.value,
-                        "mode": position.mode.value,
-                        "symbol": position.symbol,
-                        "side": position.side.value,
-                        "quantity": float(position.quantity),
-                        "avg_entry_price": float(position.avg_entry_price),
-                        "current_price": float(position.current_price) if position.current_price else None,
-                        "unrealized_pnl": float(position.unrealized_pnl),
-                        "realized_pnl": float(position.realized_pnl),
-                        "strategy_name": position.strategy_name,
-                        "opened_at": position.opened_at,
-                        "updated_at": position.updated_at,
-                        "closed_at": position.closed_at,
-                    }
-                )
-        except Exception as e:
-            logger.error(f"Error persisting position: {e}")
+    def update_prices(self, prices: Mapping[str, Decimal]) -> None:
+        """
+        Update current prices for many symbols in one vectorized pass.
+        
+        Args:
+            prices: symbol -> current market price (e.g. a feed snapshot)
+        """
+        self._last_prices.update(prices)
+        
+        rows: List[int] = []
+        pxs: List[int] = []
+        for symbol, price in prices.items():
+            ticks = self._ticks.get(symbol)
+            if ticks is not None:
+                rows.append(ticks.row)
+                pxs.append(int(price * PRICE_SCALE))
+        
+        if rows:
+            self._mark_rows(np.array(rows, dtype=np.intp), np.array(pxs, dtype=np.int64))
+    
+    def _mark_rows(self, rows: np.ndarray, prices: np.ndarray) -> None:
+        """
+        Set mark prices and recompute unrealized P&L for SoA rows.
+        
+        The product is taken in float64 since price x quantity in
+        PRICE_SCALE x QTY_SCALE units exceeds int64; the result can be
+        one minor unit off the exact scalar path on very large notionals.
+        Raises OverflowError if a row's P&L does not fit the int64 array.
+        
+        Args:
+            rows: Row indices of open positions
+            prices: Mark prices in PRICE_SCALE units, aligned with rows
+        """
+        diff = (prices - self._avg_arr[rows]) * self._side_arr[rows]
+        unrealized = np.floor(
+            diff * self._qty_arr[rows].astype(np.float64) / (QTY_SCALE * self._unrl_div)
+        )
+        if unrealized.size and np.abs(unrealized).max() >= _INT64_LIMIT:
+            raise OverflowError("Unrealized P&L exceeds the int64 tracking range")
+        self._px_arr[rows] = prices
+        self._unrl_arr[rows] = unrealized.astype(np.int64)
+    
+    def _materialize(self, symbol: str, position: Position) -> None:
+        """Write the fixed-point state of an open position to its Decimal fields."""
+        ticks = self._ticks[symbol]
+        row = ticks.row
+        ticks.write_to(position, int(self._px_arr[row]), int(self._unrl_arr[row]) * self._unrl_div)
+    
+    def _track(
+        self,
+        symbol: str,
+        ticks: _PositionTicks,
+        price: int,
+        unrealized: int = 0,
+    ) -> None:
+        """Register an open position and give it the next SoA row."""
+        row = len(self._row_symbols)
+        if row == len(self._unrl_arr):
+            self._grow_rows()
+        
+        self._row_symbols.append(symbol)
+        self._ticks[symbol] = ticks
+        ticks.row = row
+        self._sync_row(ticks)
+        self._px_arr[row] = price
+        self._unrl_arr[row] = unrealized // self._unrl_div
+    
+    def _untrack(self, symbol: str) -> None:
+        """Drop a closed position, moving the last row into its slot."""
+        ticks = self._ticks.pop(symbol)
+        row = ticks.row
+        last = len(self._row_symbols) - 1
+        
+        if row != last:
+            moved = self._row_symbols[last]
+            self._row_symbols[row] = moved
+            self._ticks[moved].row = row
+            for arr in (self._qty_arr, self._avg_arr, self._side_arr, self._px_arr, self._unrl_arr):
+                arr[row] = arr[last]
+        
+        self._row_symbols.pop()
+        self._unrl_arr[last] = 0
+    
+    def _sync_row(self, ticks: _PositionTicks) -> None:
+        """Copy quantity/average price/side of a position into its SoA row."""
+        row = ticks.row
+        self._qty_arr[row] = ticks.qty
+        self._avg_arr[row] = ticks.avg_px
+        self._side_arr[row] = 1 if ticks.is_long else -1
+    
+    def _grow_rows(self) -> None:
+        """Double the capacity of the SoA arrays."""
+        size = len(self._unrl_arr) * 2
+        self._qty_arr = np.resize(self._qty_arr, size)
+        self._avg_arr = np.resize(self._avg_arr, size)
+        self._side_arr = np.resize(self._side_arr, size)
+        self._px_arr = np.resize(self._px_arr, size)
+        self._unrl_arr = np.resize(self._unrl_arr, size)
+    
+    @staticmethod
+    def _position_row(position: Position) -> dict:
+        """Snapshot a position as upsert parameters."""
+        return {
+            "id": str(position.id),
+            "market": position.market.value,
+            "mode": position.mode.value,
+            "symbol": position.symbol,
+            "side": position.side.value,
+            "quantity": float(position.quantity),
+            "avg_entry_price": float(position.avg_entry_price),
+            "current_price": float(position.current_price) if position.current_price else None,
+            "unrealized_pnl": float(position.unrealized_pnl),
+            "realized_pnl": float(position.realized_pnl),
+            "strategy_name": position.strategy_name,
+            "opened_at": position.opened_at,
+            "updated_at": position.updated_at,
+            "closed_at": position.closed_at,
+        }
+    
+    async def _persist_positions_bulk(self, rows: List[dict]) -> None:
+        """Persist position snapshots to database with one multi-row upsert (raises on failure)."""
+        postgres = get_postgres()
+        async with postgres.session() as session:
+            await session.execute(_UPSERT_POSITION_SQL, rows)
     
     def get_total_equity(self, balance: Decimal) -> Decimal:
         """
@@ -274,8 +622,12 @@ class PositionTracker:
         Returns:
             Total equity
         """
-        return balance + sum(p.unrealized_pnl for p in self._positions.values())
+        return balance + self.get_total_unrealized_pnl()
     
     def get_total_unrealized_pnl(self) -> Decimal:
         """Get total unrealized P&L across all positions."""
-        return sum(p.unrealized_pnl for p in self._positions.values())
+        rows = self._unrl_arr[:len(self._row_symbols)]
+        total = int(rows.sum())
+        if abs(float(rows.sum(dtype=np.float64))) >= _INT64_LIMIT:
+            total = sum(rows.tolist())  # int64 sum wrapped; add exactly
+        return Decimal(total * self._unrl_div) / PRICE_SCALE
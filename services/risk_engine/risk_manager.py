@@ -5,15 +5,16 @@ Account-level risk monitoring and controls.
 
 import asyncio
 import logging
+import time
 from datetime import datetime
 from decimal import Decimal
 from typing import Optional
 
-from nats.aio.msg import Msg
+from sqlalchemy import text
 
 from shared.config import get_settings
 from shared.database import get_postgres
-from shared.messaging import Subjects, deserialize_message, ensure_connected
+from shared.messaging import ensure_connected
 from shared.models import (
     AccountSnapshot,
     Fill,
@@ -22,10 +23,31 @@ from shared.models import (
     TradingMode,
 )
 
+from .fill_bus import FillDelivery, get_fill_bus
 from .kill_switch import KillSwitch
 
 logger = logging.getLogger(__name__)
 
+_INSERT_SNAPSHOT_SQL = text("""
+    INSERT INTO account_snapshots (
+        market, mode, balance, equity, drawdown_pct,
+        peak_equity, snapshot_time
+    ) VALUES (
+        :market, :mode, :balance, :equity, :drawdown_pct,
+        :peak_equity, :snapshot_time
+    )
+""")
+
+_INSERT_RISK_EVENT_SQL = text("""
+    INSERT INTO risk_events (
+        market, mode, event_type, severity, message,
+        triggered_at, metadata
+    ) VALUES (
+        :market, :mode, :event_type, :severity, :message,
+        :triggered_at, :metadata
+    )
+""")
+
 
 class RiskManager:
     """
@@ -37,8 +59,18 @@ class RiskManager:
     - Position concentration
     
     Triggers kill switch on breach.
+    
+    Account snapshots are coalesced: an equity update is written only if
+    it moved by SNAPSHOT_MIN_CHANGE, or changed at all and
+    SNAPSHOT_MIN_INTERVAL_S has passed. A background task still writes
+    one every SNAPSHOT_MAX_INTERVAL_S.
     """
     
+    # Snapshot coalescing
+    SNAPSHOT_MIN_INTERVAL_S = 1.0
+    SNAPSHOT_MAX_INTERVAL_S = 60.0
+    SNAPSHOT_MIN_CHANGE = Decimal("0.0005")  # relative equity change
+    
     def __init__(
         self,
         market: Market,
@@ -55,11 +87,16 @@ class RiskManager:
         self._mode = mode
         self._running = False
         self._kill_switch = KillSwitch(market)
+        self._risk_alert_subject = f"RISK.ALERTS.{market.value.upper()}"
         
         # Load settings
         settings = get_settings()
         self._max_drawdown_pct = settings.risk.max_drawdown_pct
         self._daily_loss_limit_pct = settings.risk.daily_loss_limit_pct
+        
+        # Fraction of the reference equity that may be kept before a breach
+        self._drawdown_keep = 1 - self._max_drawdown_pct / 100
+        self._daily_loss_keep = 1 - self._daily_loss_limit_pct / 100
         self._max_position_size_pct = settings.risk.max_position_size_pct
         
         # State tracking
@@ -67,6 +104,16 @@ class RiskManager:
         self._peak_equity: Optional[Decimal] = None
         self._daily_start_equity: Optional[Decimal] = None
         self._current_equity: Optional[Decimal] = None
+        
+        # Equity at or below which a limit is breached (None = not checked)
+        self._drawdown_floor: Optional[Decimal] = None
+        self._daily_loss_floor: Optional[Decimal] = None
+        
+        # Last persisted snapshot (monotonic time, equity)
+        self._last_snapshot_at = 0.0
+        self._last_snapshot_equity: Optional[Decimal] = None
+        self._snapshot_task: Optional[asyncio.Task] = None
+        self._snapshot_write: Optional[asyncio.Task] = None  # in-flight write
     
     @property
     def market(self) -> Market:
@@ -91,38 +138,54 @@ class RiskManager:
         self._peak_equity = initial_equity
         self._daily_start_equity = initial_equity
         self._current_equity = initial_equity
+        self._drawdown_floor = self._floor(initial_equity, self._drawdown_keep)
+        self._daily_loss_floor = self._floor(initial_equity, self._daily_loss_keep)
         
-        # Subscribe to fills to track P&L
-        messaging = await ensure_connected()
-        await messaging.subscribe(
-            subject=Subjects.fills(self._market.value),
-            handler=self._on_fill_message,
-            durable=f"risk_manager_{self._market.value}",
+        # Receive fills from the shared risk-engine subscription to track P&L
+        # (they flow once the service calls get_fill_bus(market).start())
+        get_fill_bus(self._market).register(
+            self._on_fill,
+            legacy_durable=f"risk_manager_{self._market.value}",
         )
         
         self._running = True
+        self._snapshot_task = asyncio.create_task(self._snapshot_loop())
         logger.info(f"Risk manager started with equity={initial_equity}")
     
     async def stop(self) -> None:
         """Stop risk manager."""
         self._running = False
+        get_fill_bus(self._market).unregister(self._on_fill)
+        
+        if self._snapshot_task:
+            self._snapshot_task.cancel()
+            try:
+                await self._snapshot_task
+            except asyncio.CancelledError:
+                pass
+            self._snapshot_task = None
+        
+        if self._snapshot_write:
+            await self._snapshot_write
+            self._snapshot_write = None
+        
         logger.info("Risk manager stopped")
     
-    async def _on_fill_message(self, msg: Msg) -> None:
-        """Handle fill message for P&L tracking."""
+    async def _on_fill(self, delivery: FillDelivery) -> None:
+        """Handle fill from the bus for P&L tracking."""
         try:
-            fill = deserialize_message(msg.data, Fill)
-            await self._process_fill(fill)
-            await msg.ack()
+            await self._process_fill(delivery.fill)
         except Exception as e:
             logger.error(f"Error processing fill in risk manager: {e}")
-            await msg.nak(delay=5)
+            await delivery.nak(delay=5)
+            return
+        await delivery.ack()
     
     async def _process_fill(self, fill: Fill) -> None:
         """Process fill for P&L calculation."""
         # Update equity (simplified - in production would track positions)
         # This is a placeholder - real implementation would calculate realized P&L
-        logger.debug(f"Risk manager processed fill: {fill.symbol}")
+        logger.debug("Risk manager processed fill: %s", fill.symbol)
     
     async def update_equity(self, new_equity: Decimal) -> None:
         """
@@ -136,69 +199,85 @@ class RiskManager:
         # Update peak
         if self._peak_equity is None or new_equity > self._peak_equity:
             self._peak_equity = new_equity
+            self._drawdown_floor = self._floor(new_equity, self._drawdown_keep)
         
-        # Check drawdown
-        await self._check_drawdown()
-        
-        # Check daily loss
-        await self._check_daily_loss()
+        # Check drawdown and daily loss (two comparisons against cached floors)
+        if self._drawdown_floor is not None and new_equity <= self._drawdown_floor:
+            await self._on_drawdown_breach()
+        if self._daily_loss_floor is not None and new_equity <= self._daily_loss_floor:
+            await self._on_daily_loss_breach()
         
-        # Persist snapshot
-        await self._persist_snapshot()
+        # Persist snapshot (coalesced, written in the background)
+        write = self._snapshot_write
+        if (write is None or write.done()) and self._snapshot_due(time.monotonic()):
+            self._snapshot_write = asyncio.create_task(self._persist_snapshot())
     
-    async def _check_drawdown(self) -> None:
-        """Check account drawdown against limit."""
-        if self._peak_equity is None or self._current_equity is None:
-            return
-        
-        if self._peak_equity == 0:
-            return
+    @staticmethod
+    def _floor(reference: Optional[Decimal], keep: Decimal) -> Optional[Decimal]:
+        """Equity level at which a loss limit relative to reference is hit."""
+        if reference is None or reference == 0:
+            return None
+        return reference * keep
+    
+    def _snapshot_due(self, now: float) -> bool:
+        """Check whether the current equity is worth a new snapshot row."""
+        last = self._last_snapshot_equity
+        if last is None:
+            return True
         
+        current = self._current_equity
+        if current == last:
+            return False
+        if now - self._last_snapshot_at >= self.SNAPSHOT_MIN_INTERVAL_S:
+            return True
+        return last != 0 and abs(current - last) / abs(last) > self.SNAPSHOT_MIN_CHANGE
+    
+    async def _snapshot_loop(self) -> None:
+        """Write a snapshot at least every SNAPSHOT_MAX_INTERVAL_S."""
+        while self._running:
+            await asyncio.sleep(self.SNAPSHOT_MAX_INTERVAL_S)
+            if time.monotonic() - self._last_snapshot_at >= self.SNAPSHOT_MAX_INTERVAL_S:
+                await self._persist_snapshot()
+    
+    async def _on_drawdown_breach(self) -> None:
+        """Alert and trigger kill switch on drawdown breach."""
         drawdown_pct = (
             (self._peak_equity - self._current_equity) / self._peak_equity * 100
         )
         
-        if drawdown_pct >= self._max_drawdown_pct:
-            await self._trigger_risk_alert(
-                event_type="drawdown_breach",
-                severity="critical",
-                message=f"Drawdown {drawdown_pct:.2f}% exceeds limit {self._max_drawdown_pct}%",
-                triggered_value=drawdown_pct,
-                threshold_value=self._max_drawdown_pct,
-            )
-            
-            # Trigger kill switch
-            await self._kill_switch.trigger(
-                reason=f"Drawdown breach: {drawdown_pct:.2f}%",
-                triggered_by="drawdown",
-            )
-    
-    async def _check_daily_loss(self) -> None:
-        """Check daily loss against limit."""
-        if self._daily_start_equity is None or self._current_equity is None:
-            return
-        
-        if self._daily_start_equity == 0:
-            return
+        await self._trigger_risk_alert(
+            event_type="drawdown_breach",
+            severity="critical",
+            message=f"Drawdown {drawdown_pct:.2f}% exceeds limit {self._max_drawdown_pct}%",
+            triggered_value=drawdown_pct,
+            threshold_value=self._max_drawdown_pct,
+        )
         
+        # Trigger kill switch
+        await self._kill_switch.trigger(
+            reason=f"Drawdown breach: {drawdown_pct:.2f}%",
+            triggered_by="drawdown",
+        )
+    
+    async def _on_daily_loss_breach(self) -> None:
+        """Alert and trigger kill switch on daily loss breach."""
         daily_loss_pct = (
             (self._daily_start_equity - self._current_equity) / self._daily_start_equity * 100
         )
         
-        if daily_loss_pct >= self._daily_loss_limit_pct:
-            await self._trigger_risk_alert(
-                event_type="daily_loss_breach",
-                severity="critical",
-                message=f"Daily loss {daily_loss_pct:.2f}% exceeds limit {self._daily_loss_limit_pct}%",
-                triggered_value=daily_loss_pct,
-                threshold_value=self._daily_loss_limit_pct,
-            )
-            
-            # Trigger kill switch
-            await self._kill_switch.trigger(
-                reason=f"Daily loss breach: {daily_loss_pct:.2f}%",
-                triggered_by="daily_loss",
-            )
+        await self._trigger_risk_alert(
+            event_type="daily_loss_breach",
+            severity="critical",
+            message=f"Daily loss {daily_loss_pct:.2f}% exceeds limit {self._daily_loss_limit_pct}%",
+            triggered_value=daily_loss_pct,
+            threshold_value=self._daily_loss_limit_pct,
+        )
+        
+        # Trigger kill switch
+        await self._kill_switch.trigger(
+            reason=f"Daily loss breach: {daily_loss_pct:.2f}%",
+            triggered_by="daily_loss",
+        )
     
     async def _trigger_risk_alert(
         self,
@@ -223,7 +302,7 @@ class RiskManager:
             )
             
             await messaging.publish(
-                subject=f"RISK.ALERTS.{self._market.value.upper()}",
+                subject=self._risk_alert_subject,
                 data=alert,
             )
             
@@ -240,11 +319,12 @@ class RiskManager:
         if self._current_equity is None:
             return
         
+        self._last_snapshot_at = time.monotonic()
+        self._last_snapshot_equity = self._current_equity
+        
         try:
             postgres = get_postgres()
             async with postgres.session() as session:
-                from sqlalchemy import text
-                
                 drawdown_pct = Decimal("0")
                 if self._peak_equity and self._peak_equity > 0:
                     drawdown_pct = (
@@ -252,15 +332,7 @@ class RiskManager:
                     )
                 
                 await session.execute(
-                    text("""
-                        INSERT INTO account_snapshots (
-                            market, mode, balance, equity, drawdown_pct,
-                            peak_equity, snapshot_time
-                        ) VALUES (
-                            :market, :mode, :balance, :equity, :drawdown_pct,
-                            :peak_equity, :snapshot_time
-                        )
-                    """),
+                    _INSERT_SNAPSHOT_SQL,
                     {
                         "market": self._market.value,
                         "mode": self._mode.value,
@@ -279,18 +351,8 @@ class RiskManager:
         try:
             postgres = get_postgres()
             async with postgres.session() as session:
-                from sqlalchemy import text
-                
                 await session.execute(
-                    text("""
-                        INSERT INTO risk_events (
-                            market, mode, event_type, severity, message,
-                            triggered_at, metadata
-                        ) VALUES (
-                            :market, :mode, :event_type, :severity, :message,
-                            :triggered_at, :metadata
-                        )
-                    """),
+                    _INSERT_RISK_EVENT_SQL,
                     {
                         "market": alert.market.value,
                         "mode": alert.mode.value,
@@ -307,4 +369,5 @@ class RiskManager:
     def reset_daily(self) -> None:
         """Reset daily tracking (call at start of trading day)."""
         self._daily_start_equity = self._current_equity
+        self._daily_loss_floor = self._floor(self._current_equity, self._daily_loss_keep)
         logger.info(f"Daily equity reset to {self._daily_start_equity}")
@@ -165,33 +165,36 @@ class SignalGenerationEngine:
         result = self._strategy.on_candle(candle, context)
         
         # Publish any signals
-        for signal in result.signals:
-            await self._publish_signal(signal)
+        if result.signals:
+            await self._publish_signals(result.signals)
     
-    async def _publish_signal(self, signal: Signal) -> None:
-        """Publish signal to NATS (skipped in standalone mode)."""
+    async def _publish_signals(self, signals: List[Signal]) -> None:
+        """Publish one candle's signals to NATS as a batch (skipped in standalone mode)."""
         if ensure_connected is None or Subjects is None:
             return
         
         settings = get_settings()
         if settings.standalone_mode:
-            logger.info(f"Signal (standalone): {signal.action} {signal.symbol}")
+            for signal in signals:
+                logger.info(f"Signal (standalone): {signal.action} {signal.symbol}")
             return
 
         try:
             messaging = await ensure_connected()
-            await messaging.publish(
-                subject=Subjects.signals(self._market.value),
-                data=signal,
-                msg_id=str(signal.id),  # Deduplication
+            await messaging.publish_many(
+                Subjects.signals(self._market.value),
+                signals,
+                msg_ids=[str(signal.id) for signal in signals],  # Deduplication
             )
+        except Exception as e:
+            logger.error(f"Error publishing signals: {e}")
+            return
+        
+        for signal in signals:
             logger.info(f"Published signal: {signal.action} {signal.symbol}")
             
             # Also persist to database
             await self._persist_signal(signal)
-            
-        except Exception as e:
-            logger.error(f"Error publishing signal: {e}")
     
     async def _persist_signal(self, signal: Signal) -> None:
         """Persist signal to PostgreSQL (skipped in standalone mode)."""
@@ -62,6 +62,8 @@ class StrategyWrapper:
         self._strategy = strategy
         self._name = name
         self._initialized = False
+        # Resolved once; strategies are fixed for the life of the process
+        self._on_candle: Optional[Callable[..., Any]] = getattr(strategy, "on_candle", None)
     
     @property
     def name(self) -> str:
@@ -99,8 +101,9 @@ class StrategyWrapper:
         if not self._initialized:
             self.initialize()
         
-        if hasattr(self._strategy, "on_candle"):
-            result = self._strategy.on_candle(candle, context)
+        on_candle = self._on_candle
+        if on_candle is not None:
+            result = on_candle(candle, context)
             if isinstance(result, StrategyResult):
                 return result
             elif isinstance(result, list):
@@ -186,16 +189,22 @@ def get_strategy(strategy_name: str, expected_team: TeamType | None = None) -> S
     """
     Get a strategy, loading it if necessary.
     
+    The cache is keyed on strategy name only, so every caller shares one
+    wrapper per strategy; use reset() rather than clear_strategy_cache()
+    to start from fresh state.
+    
     Args:
         strategy_name: Strategy module name
+        expected_team: Optional team type contract for validation
         
     Returns:
         Cached or newly loaded StrategyWrapper
     """
-    cache_key = f"{strategy_name}:{expected_team.value if expected_team else 'auto'}"
-    if cache_key not in _loaded_strategies:
-        _loaded_strategies[cache_key] = load_strategy(strategy_name, expected_team=expected_team)
-    return _loaded_strategies[cache_key]
+    if strategy_name not in _loaded_strategies:
+        _loaded_strategies[strategy_name] = load_strategy(strategy_name, expected_team=expected_team)
+    elif expected_team is not None:
+        resolve_strategy_team(strategy_name, expected_team)
+    return _loaded_strategies[strategy_name]
 
 
 def clear_strategy_cache() -> None:
@@ -0,0 +1,75 @@
+"""
+Payload Codec
+zstd compression for NATS message payloads.
+
+Publishers compress serialized payloads above COMPRESS_MIN_BYTES and
+tag them with a Content-Encoding header; subscribers check the header
+and decompress before deserialization. Messages without the header
+are passed through unchanged, so uncompressed publishers keep working.
+"""
+
+from typing import Mapping, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # type: ignore
+
+CONTENT_ENCODING_HEADER = "Content-Encoding"
+ZSTD_ENCODING = "zstd"
+
+# Smaller payloads (single ticks/candles) are sent as-is: the frame
+# overhead eats most of the saving and compression still costs CPU
+COMPRESS_MIN_BYTES = 1024
+
+# Shared compressor for the publish path (level 3: fast, ~5x on JSON ticks)
+PUBLISH_CODEC = zstandard.ZstdCompressor(level=3) if zstandard is not None else None
+
+# Shared decompressor for the subscribe path
+_DECOMPRESSOR = zstandard.ZstdDecompressor() if zstandard is not None else None
+
+
+def compress_payload(payload: bytes) -> Tuple[bytes, Optional[str]]:
+    """
+    Compress a serialized payload for publishing.
+
+    Args:
+        payload: Serialized message bytes
+
+    Returns:
+        Tuple of (payload, content_encoding). content_encoding is None
+        when the payload is left as-is (below COMPRESS_MIN_BYTES, or
+        zstandard is not installed).
+    """
+    if PUBLISH_CODEC is None or len(payload) < COMPRESS_MIN_BYTES:
+        return payload, None
+    return PUBLISH_CODEC.compress(payload), ZSTD_ENCODING
+
+
+def decompress_payload(
+    payload: bytes,
+    headers: Optional[Mapping[str, str]] = None,
+) -> bytes:
+    """
+    Decompress a received payload according to its Content-Encoding header.
+
+    Args:
+        payload: Raw message bytes
+        headers: Message headers (may be None)
+
+    Returns:
+        Decompressed payload bytes
+
+    Raises:
+        ValueError: If the content encoding is unsupported
+    """
+    encoding = headers.get(CONTENT_ENCODING_HEADER) if headers else None
+    if encoding is None:
+        return payload
+
+    if encoding != ZSTD_ENCODING:
+        raise ValueError(f"Unsupported content encoding: {encoding}")
+    if _DECOMPRESSOR is None:
+        raise ValueError("zstd payload received but zstandard is not installed")
+
+    return _DECOMPRESSOR.decompress(payload)
@@ -198,6 +198,36 @@ class QuestDBDatabase:
             logger.error(f"QuestDB query failed: {e}")
             raise
     
+    def query_columns(self, sql: str, timeout: int = 30) -> Dict[str, List[Any]]:
+        """
+        Execute SQL query via HTTP API and return the result column-wise.
+        
+        Avoids building a dict per row for large scans (e.g. backtest loads).
+        
+        Args:
+            sql: SQL query string
+            timeout: Request timeout in seconds
+            
+        Returns:
+            Column name -> list of values, all lists in row order
+        """
+        url = f"{self.http_url}/exec"
+        try:
+            response = requests.get(url, params={"query": sql}, timeout=timeout)
+            response.raise_for_status()
+            
+            data = response.json()
+            column_names = [col["name"] for col in data.get("columns", [])]
+            dataset = data.get("dataset") or []
+            
+            if not dataset:
+                return {name: [] for name in column_names}
+            return dict(zip(column_names, map(list, zip(*dataset))))
+            
+        except requests.RequestException as e:
+            logger.error(f"QuestDB query failed: {e}")
+            raise
+    
     def health_check(self) -> bool:
         """Check QuestDB connectivity."""
         try:
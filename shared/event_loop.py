@@ -0,0 +1,32 @@
+"""
+Event Loop Bootstrap
+Runs async entrypoints on uvloop when it is installed.
+
+uvloop is not available on Windows, so entrypoints fall back to the
+default asyncio loop there.
+"""
+
+import asyncio
+from typing import Any, Coroutine, TypeVar
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None  # type: ignore
+
+T = TypeVar("T")
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:
+    """
+    Drop-in replacement for asyncio.run() that prefers uvloop.
+
+    Args:
+        main: Top-level coroutine
+
+    Returns:
+        The coroutine's result
+    """
+    if uvloop is not None:
+        return uvloop.run(main)
+    return asyncio.run(main)
@@ -8,9 +8,11 @@ import random
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import List, Optional, Sequence
 from uuid import UUID, uuid4
 
+import numpy as np
+
 from shared.config import get_settings
 from shared.models import Fill, Market, Order, OrderSide, OrderType, TradingMode
 
@@ -153,10 +155,22 @@ class FillSimulator:
         rate = self._settings.get_commission_rate(market)
         commission = notional * rate
         
-        # Commission asset (typically quote currency)
-        commission_asset = "USD" if market == Market.US else "USDT" if market == Market.CRYPTO else "KRW"
-        
-        return commission, commission_asset
+        return commission, self._commission_asset(market)
+    
+    @staticmethod
+    def _commission_asset(market: Market) -> str:
+        """Commission asset (typically quote currency)."""
+        return "USD" if market == Market.US else "USDT" if market == Market.CRYPTO else "KRW"
+    
+    @staticmethod
+    def _base_price(order: Order, market_price: Decimal) -> Decimal:
+        """Determine the pre-slippage execution price for an order."""
+        if order.order_type == OrderType.LIMIT and order.price:
+            # Limit order: use limit price if it would be filled
+            if order.side is OrderSide.BUY:
+                return min(order.price, market_price)
+            return max(order.price, market_price)
+        return market_price
     
     def simulate_fill(
         self,
@@ -181,16 +195,7 @@ class FillSimulator:
         timestamp = timestamp or datetime.utcnow()
         
         # Determine base price
-        if order.order_type == OrderType.MARKET:
-            base_price = market_price
-        elif order.order_type == OrderType.LIMIT and order.price:
-            # Limit order: use limit price if it would be filled
-            if order.side == OrderSide.BUY:
-                base_price = min(order.price, market_price)
-            else:
-                base_price = max(order.price, market_price)
-        else:
-            base_price = market_price
+        base_price = self._base_price(order, market_price)
         
         # Apply slippage
         executed_price, slippage_bps = self.calculate_slippage(
@@ -239,6 +244,95 @@ class FillSimulator:
             commission=commission,
         )
     
+    def simulate_fills_batch(
+        self,
+        orders: Sequence[Order],
+        market_prices: Sequence[Decimal],
+        timestamp: Optional[datetime] = None,
+    ) -> List[FillResult]:
+        """
+        Simulate fills for many orders at once (backtest fast path).
+        
+        Same model as simulate_fill(), but slippage, latency, and
+        commission are computed on float64 arrays; values are converted
+        back to Decimal only when building each Fill. Random draws come
+        from a NumPy generator seeded off the `random` module, so results
+        stay reproducible under the simulator's random_seed.
+        
+        Args:
+            orders: Orders to fill
+            market_prices: Current market price per order
+            timestamp: Fill timestamp (defaults to now)
+            
+        Returns:
+            FillResult per order, in input order
+        """
+        n = len(orders)
+        if n == 0:
+            return []
+        
+        timestamp = timestamp or datetime.utcnow()
+        
+        base_prices = np.fromiter(
+            (float(self._base_price(o, p)) for o, p in zip(orders, market_prices)),
+            dtype=np.float64, count=n,
+        )
+        quantities = np.fromiter((float(o.remaining_quantity) for o in orders), dtype=np.float64, count=n)
+        sides = np.fromiter((1 if o.side is OrderSide.BUY else -1 for o in orders), dtype=np.int8, count=n)
+        base_bps = np.fromiter((self.get_slippage_bps(o.market) for o in orders), dtype=np.float64, count=n)
+        rates = np.fromiter(
+            (float(self._settings.get_commission_rate(o.market)) for o in orders),
+            dtype=np.float64, count=n,
+        )
+        
+        rng = np.random.default_rng(random.getrandbits(64))
+        
+        # Slippage: 0.5x to 1.5x base, always against the order side
+        slippage_bps = base_bps * rng.uniform(0.5, 1.5, n)
+        executed_prices = base_prices * (1 + sides * slippage_bps / 10000)
+        
+        # Latency: min latency plus 0-100% jitter, never zero
+        min_latency = self.get_min_latency_ms()
+        latencies = np.maximum((min_latency * (1 + rng.uniform(0, 1.0, n))).astype(np.int64), 1)
+        
+        commissions = quantities * executed_prices * rates
+        
+        results: List[FillResult] = []
+        for i, (order, market_price) in enumerate(zip(orders, market_prices)):
+            executed_price = Decimal(str(executed_prices[i]))
+            bps = Decimal(str(slippage_bps[i]))
+            commission = Decimal(str(commissions[i]))
+            latency_ms = int(latencies[i])
+            
+            fill = Fill(
+                id=uuid4(),
+                timestamp=timestamp,
+                market=order.market,
+                order_id=order.id,
+                mode=order.mode,
+                symbol=order.symbol,
+                side=order.side,
+                quantity=order.remaining_quantity,
+                price=executed_price,
+                commission=commission,
+                commission_asset=self._commission_asset(order.market),
+                slippage_bps=bps,
+                latency_ms=latency_ms,
+                metadata={
+                    "market_price": str(market_price),
+                    "order_type": order.order_type.value,
+                },
+            )
+            results.append(FillResult(
+                fill=fill,
+                executed_price=executed_price,
+                slippage_bps=bps,
+                latency_ms=latency_ms,
+                commission=commission,
+            ))
+        
+        return results
+    
     def can_fill_limit_order(
         self,
         order: Order,
@@ -257,7 +351,7 @@ class FillSimulator:
         if order.order_type != OrderType.LIMIT or order.price is None:
             return True  # Market orders always fillable
         
-        if order.side == OrderSide.BUY:
+        if order.side is OrderSide.BUY:
             # Buy limit: fill if market price <= limit price
             return market_price <= order.price
         else:
@@ -285,7 +379,7 @@ class FillSimulator:
         if order.stop_price is None:
             return False
         
-        if order.side == OrderSide.BUY:
+        if order.side is OrderSide.BUY:
             # Buy stop: trigger if market price >= stop price
             return market_price >= order.stop_price
         else:
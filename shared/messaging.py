@@ -7,7 +7,8 @@ import asyncio
 import json
 import logging
 from datetime import datetime
-from typing import Any, Callable, Coroutine, Dict, List, Optional, Type, TypeVar
+from functools import lru_cache
+from typing import Any, Callable, Coroutine, Dict, List, Literal, Optional, Sequence, Tuple, Type, TypeVar
 from uuid import UUID
 
 import nats
@@ -15,8 +16,15 @@ from nats.aio.client import Client as NatsClient
 from nats.aio.msg import Msg
 from nats.js import JetStreamContext
 from nats.js.api import ConsumerConfig, DeliverPolicy
+from nats.js.errors import NotFoundError
 from pydantic import BaseModel
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+from shared.codec import CONTENT_ENCODING_HEADER, compress_payload, decompress_payload
 from shared.config import get_settings
 
 logger = logging.getLogger(__name__)
@@ -37,17 +45,35 @@ class MessageEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+# Shared encoder for non-model payloads (compact, UTF-8 passthrough)
+_ENCODER = MessageEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def _orjson_default(obj: Any) -> Any:
+    """orjson fallback for types it does not serialize natively."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 def serialize_message(data: Any) -> bytes:
     """Serialize data to bytes for NATS."""
-    return json.dumps(data, cls=MessageEncoder).encode("utf-8")
+    if isinstance(data, BaseModel):
+        # pydantic-core writes JSON bytes directly, skipping the dict round-trip
+        return data.__pydantic_serializer__.to_json(data)
+    if orjson is not None:
+        # datetime and UUID are native to orjson
+        return orjson.dumps(data, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+    return _ENCODER.encode(data).encode("utf-8")
 
 
 def deserialize_message(data: bytes, model_class: Optional[Type[T]] = None) -> Any:
     """Deserialize NATS message to dict or Pydantic model."""
-    parsed = json.loads(data.decode("utf-8"))
     if model_class is not None:
-        return model_class.model_validate(parsed)
-    return parsed
+        return model_class.model_validate_json(data)
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 class NatsMessaging:
@@ -55,10 +81,14 @@ class NatsMessaging:
     
     _instance: Optional["NatsMessaging"] = None
     
+    # Unconfirmed publish_async() acks allowed before the publisher waits
+    MAX_PENDING_ACKS = 256
+    
     def __init__(self) -> None:
         self._nc: Optional[NatsClient] = None
         self._js: Optional[JetStreamContext] = None
         self._subscriptions: List[Any] = []
+        self._pending_acks: List[asyncio.Task] = []
         self._connected = False
     
     @classmethod
@@ -108,6 +138,8 @@ class NatsMessaging:
                 pass
         self._subscriptions.clear()
         
+        await self.flush()
+        
         if self._nc:
             await self._nc.drain()
             self._nc = None
@@ -127,32 +159,136 @@ class NatsMessaging:
         data: Any,
         headers: Optional[Dict[str, str]] = None,
         msg_id: Optional[str] = None,
+        reliability: Literal["js", "core"] = "js",
     ) -> None:
         """
         Publish message to a subject.
         
+        "js" waits for the JetStream ack, so the message is known to be
+        stored. "core" is a plain NATS publish with no ack: a stream bound
+        to the subject still stores the message and consumers see it as
+        usual, but the publisher is not told if it was dropped (server
+        restart, stream limits). Use "core" only for loss-tolerant data
+        such as candles.
+        
         Args:
             subject: NATS subject (e.g., "MARKET.CANDLES.CRYPTO")
             data: Data to publish (Pydantic model or dict)
             headers: Optional message headers
             msg_id: Optional message ID for deduplication
+            reliability: "js" (acked) or "core" (fire-and-forget)
         """
         if not self._js:
             raise RuntimeError("Not connected to NATS")
         
-        payload = serialize_message(data)
+        payload, nats_headers = self._encode(data, headers, msg_id)
+        
+        if reliability == "core":
+            await self._nc.publish(subject, payload, headers=nats_headers)
+            return
+        
+        ack = await self._js.publish(subject, payload, headers=nats_headers)
+        
+        logger.debug(f"Published to {subject}: stream={ack.stream}, seq={ack.seq}")
+    
+    async def publish_async(
+        self,
+        subject: str,
+        data: Any,
+        headers: Optional[Dict[str, str]] = None,
+        msg_id: Optional[str] = None,
+    ) -> None:
+        """
+        Publish message without waiting for its JetStream ack.
+        
+        Acks are collected and awaited in batches once MAX_PENDING_ACKS
+        are outstanding, or on flush(). Publish failures are logged, not
+        raised, so use publish() for subjects where the caller must know
+        the message was stored (e.g. fills); order events use this path.
+        
+        Args:
+            subject: NATS subject
+            data: Data to publish (Pydantic model or dict)
+            headers: Optional message headers
+            msg_id: Optional message ID for deduplication
+        """
+        if not self._js:
+            raise RuntimeError("Not connected to NATS")
+        
+        payload, nats_headers = self._encode(data, headers, msg_id)
+        self._pending_acks.append(
+            asyncio.create_task(self._js.publish(subject, payload, headers=nats_headers))
+        )
+        
+        if len(self._pending_acks) >= self.MAX_PENDING_ACKS:
+            await self.flush()
+    
+    async def publish_many(
+        self,
+        subject: str,
+        items: Sequence[Any],
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        msg_ids: Optional[Sequence[str]] = None,
+        batch: int = 64,
+    ) -> None:
+        """
+        Publish a burst of messages, confirming them one batch at a time.
+        
+        Each batch is sent back to back and its acks are awaited together,
+        so a burst costs one round trip per batch instead of per message.
+        Raises if any publish in a batch fails; later batches are not sent.
+        
+        Args:
+            subject: NATS subject
+            items: Data to publish (Pydantic models or dicts), in order
+            headers: Optional headers applied to every message
+            msg_ids: Optional per-item message IDs for deduplication
+            batch: Messages per confirmed batch
+        """
+        if not self._js:
+            raise RuntimeError("Not connected to NATS")
+        
+        ids = msg_ids if msg_ids is not None else [None] * len(items)
+        encoded = [
+            self._encode(item, dict(headers) if headers else None, msg_id)
+            for item, msg_id in zip(items, ids)
+        ]
+        for start in range(0, len(encoded), batch):
+            await asyncio.gather(*(
+                self._js.publish(subject, payload, headers=nats_headers)
+                for payload, nats_headers in encoded[start:start + batch]
+            ))
+        
+        logger.debug(f"Published {len(encoded)} messages to {subject}")
+    
+    async def flush(self) -> None:
+        """Wait for all outstanding publish_async() acks."""
+        if not self._pending_acks:
+            return
+        
+        pending, self._pending_acks = self._pending_acks, []
+        results = await asyncio.gather(*pending, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Async publish failed: {result}")
+    
+    @staticmethod
+    def _encode(
+        data: Any,
+        headers: Optional[Dict[str, str]],
+        msg_id: Optional[str],
+    ) -> Tuple[bytes, Optional[Dict[str, str]]]:
+        """Serialize and compress a payload and build its NATS headers."""
+        payload, encoding = compress_payload(serialize_message(data))
         
         nats_headers = headers or {}
         if msg_id:
             nats_headers["Nats-Msg-Id"] = msg_id
+        if encoding:
+            nats_headers[CONTENT_ENCODING_HEADER] = encoding
         
-        ack = await self._js.publish(
-            subject,
-            payload,
-            headers=nats_headers if nats_headers else None,
-        )
-        
-        logger.debug(f"Published to {subject}: stream={ack.stream}, seq={ack.seq}")
+        return payload, nats_headers if nats_headers else None
     
     async def subscribe(
         self,
@@ -161,6 +297,7 @@ class NatsMessaging:
         durable: Optional[str] = None,
         queue: Optional[str] = None,
         deliver_policy: DeliverPolicy = DeliverPolicy.NEW,
+        opt_start_seq: Optional[int] = None,
     ) -> None:
         """
         Subscribe to a subject with a message handler.
@@ -171,19 +308,29 @@ class NatsMessaging:
             durable: Durable consumer name
             queue: Queue group for load balancing
             deliver_policy: Message delivery policy
+            opt_start_seq: First stream sequence (overrides deliver_policy)
         """
         if not self._js:
             raise RuntimeError("Not connected to NATS")
         
+        if opt_start_seq is not None:
+            deliver_policy = DeliverPolicy.BY_START_SEQUENCE
+        
         config = ConsumerConfig(
             durable_name=durable,
             deliver_policy=deliver_policy,
+            opt_start_seq=opt_start_seq,
         )
         
+        async def decoding_handler(msg: Msg) -> None:
+            # Undo publisher-side compression before the handler sees the payload
+            msg.data = decompress_payload(msg.data, msg.headers)
+            await handler(msg)
+        
         if queue:
             sub = await self._js.subscribe(
                 subject,
-                cb=handler,
+                cb=decoding_handler,
                 durable=durable,
                 queue=queue,
                 config=config,
@@ -191,7 +338,7 @@ class NatsMessaging:
         else:
             sub = await self._js.subscribe(
                 subject,
-                cb=handler,
+                cb=decoding_handler,
                 durable=durable,
                 config=config,
             )
@@ -228,6 +375,38 @@ class NatsMessaging:
         
         await self.subscribe(subject, wrapper, durable, queue)
     
+    async def durable_ack_floor(self, subject: str, durable: str) -> Optional[int]:
+        """
+        Get the last stream sequence a durable consumer has acked.
+        
+        Args:
+            subject: Subject whose stream holds the consumer
+            durable: Durable consumer name
+            
+        Returns:
+            Acked stream sequence, or None if the durable does not exist
+        """
+        if not self._js:
+            raise RuntimeError("Not connected to NATS")
+        
+        stream = await self._js.find_stream_name_by_subject(subject)
+        try:
+            info = await self._js.consumer_info(stream, durable)
+        except NotFoundError:
+            return None
+        return info.ack_floor.stream_seq if info.ack_floor else 0
+    
+    async def delete_durable(self, subject: str, durable: str) -> None:
+        """Delete a durable consumer (no-op if it does not exist)."""
+        if not self._js:
+            raise RuntimeError("Not connected to NATS")
+        
+        stream = await self._js.find_stream_name_by_subject(subject)
+        try:
+            await self._js.delete_consumer(stream, durable)
+        except NotFoundError:
+            pass
+    
     async def request(
         self,
         subject: str,
@@ -289,21 +468,25 @@ class Subjects:
     COMMANDS = "SYSTEM.COMMANDS.*"
     
     @classmethod
+    @lru_cache(maxsize=None)
     def candles(cls, market: str) -> str:
         """Get candles subject for market."""
         return f"MARKET.CANDLES.{market.upper()}"
     
     @classmethod
+    @lru_cache(maxsize=None)
     def signals(cls, market: str) -> str:
         """Get signals subject for market."""
         return f"STRATEGY.SIGNALS.{market.upper()}"
     
     @classmethod
+    @lru_cache(maxsize=None)
     def orders(cls, market: str) -> str:
         """Get orders subject for market."""
         return f"TRADE.ORDERS.{market.upper()}"
     
     @classmethod
+    @lru_cache(maxsize=None)
     def fills(cls, market: str) -> str:
         """Get fills subject for market."""
         return f"TRADE.FILLS.{market.upper()}"
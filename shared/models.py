@@ -8,12 +8,23 @@ This module is the SINGLE SOURCE OF TRUTH for all data models.
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
+from functools import cached_property
 from typing import Any, Optional
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, Field, ConfigDict
 
 
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Fixed-Point Scales
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+# Minor units for integer price/quantity arithmetic (1e-8, satoshi precision).
+# Models stay Decimal-typed; convert at the boundary with these scales.
+PRICE_SCALE = 10**8
+QTY_SCALE = 10**8
+
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # Enums
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -157,6 +168,11 @@ class Order(BaseModel):
     error_message: Optional[str] = None
     metadata: dict[str, Any] = Field(default_factory=dict)
     
+    @cached_property
+    def id_str(self) -> str:
+        """String form of the order id (computed once, used as a dict key)."""
+        return str(self.id)
+    
     @property
     def remaining_quantity(self) -> Decimal:
         """Calculate remaining quantity to fill."""
@@ -14,6 +14,7 @@ from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
+from itertools import islice
 from typing import Deque, Dict, List, Optional
 
 from shared.models import (
@@ -27,6 +28,8 @@ from shared.models import (
 
 logger = logging.getLogger(__name__)
 
+_FULL_STRENGTH = Decimal("1.0")
+
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # 전략 설정 (Strategy Config)
@@ -82,7 +85,7 @@ STRATEGY_CONFIG = {
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
 
-@dataclass
+@dataclass(slots=True)
 class SymbolState:
     """Per-symbol strategy state."""
     highs: Deque[Decimal] = field(default_factory=lambda: deque(maxlen=20))
@@ -157,8 +160,9 @@ class Strategy:
         
         # Calculate breakout levels
         # Note: We exclude current bar to prevent look-ahead
-        entry_high = max(list(state.highs)[:-1]) if len(state.highs) > 1 else candle.high
-        exit_low = min(list(state.lows)[:-1]) if len(state.lows) > 1 else candle.low
+        highs, lows = state.highs, state.lows
+        entry_high = max(islice(highs, len(highs) - 1)) if len(highs) > 1 else candle.high
+        exit_low = min(islice(lows, len(lows) - 1)) if len(lows) > 1 else candle.low
         
         # Check for entry signal (not in position)
         if not state.in_position:
@@ -168,7 +172,7 @@ class Strategy:
                     mode=context.mode,
                     symbol=candle.symbol,
                     action=SignalAction.ENTER_LONG,
-                    strength=Decimal("1.0"),
+                    strength=_FULL_STRENGTH,
                     price_at_signal=candle.close,
                     strategy_name=self.name,
                     metadata={
@@ -193,7 +197,7 @@ class Strategy:
                     mode=context.mode,
                     symbol=candle.symbol,
                     action=SignalAction.EXIT_LONG,
-                    strength=Decimal("1.0"),
+                    strength=_FULL_STRENGTH,
                     price_at_signal=candle.close,
                     strategy_name=self.name,
                     metadata={